@@ -107,3 +107,30 @@ def migration2() -> domain_migration.Migration:
         name="321",
         is_applied=False,
     )
+
+
+@pytest.fixture(scope="function")
+def make_migration() -> typing.Callable[..., domain_migration.Migration]:
+    def factory(
+        version: int, touches: typing.Optional[typing.Iterable[str]] = None
+    ) -> domain_migration.Migration:
+        return domain_migration.Migration(
+            checksum=str(version),
+            description=str(version),
+            downgrade_process=domain_migration.MigrationProcess(
+                commands=[],
+                migration_version=version,
+                name="downgrade",
+            ),
+            upgrade_process=domain_migration.MigrationProcess(
+                commands=[],
+                migration_version=version,
+                name="upgrade",
+            ),
+            version=version,
+            name=str(version),
+            is_applied=False,
+            touches=touches,
+        )
+
+    return factory
@@ -203,9 +203,9 @@ def migration(process_func: types.FunctionType, /) -> domain_migration.Migration
     -------
     domain_migration.MigrationProcess
         A migration process object that contains information about the migration
-        version, process name, and set of migration commands. If the function
-        returns an already created migration process, no new objects will be
-        created.
+        version, process name, and set of migration commands. The commands are
+        stored as an immutable tuple. If the function returns an already created
+        migration process, no new objects will be created.
 
     Raises
     ------
@@ -222,7 +222,11 @@ def migration(process_func: types.FunctionType, /) -> domain_migration.Migration
     if isinstance(func_callback, domain_migration.MigrationProcess):
         return func_callback
 
-    if not isinstance(func_callback, collections.abc.Sequence):
+    # Lists and tuples are checked first, so the common case does not go
+    # through the ABC machinery; other sequences are still accepted.
+    if not isinstance(func_callback, (list, tuple)) and not isinstance(
+        func_callback, collections.abc.Sequence
+    ):
         raise ValueError(
             f"Migration process func {process_func!r} must return sequence of commands."
         )
@@ -236,7 +240,9 @@ def migration(process_func: types.FunctionType, /) -> domain_migration.Migration
         raise AttributeError(f"Migration module {func_file!r} should have 'version' variable.")
 
     return domain_migration.MigrationProcess(
-        func_callback,
+        # Stored as a tuple once, so the commands can not be changed after
+        # the process was created and callers never need a defensive copy.
+        tuple(func_callback),
         migration_version=version,
         name=getattr(process_func, "__name__", "UNDEFINED_PROCESS"),
     )
@@ -26,13 +26,13 @@ __all__: typing.Sequence[str] = (
 )
 
 import abc
-import functools
+import asyncio
+import concurrent.futures
+import itertools
 import logging
 import operator
 import typing
 
-import typing_extensions
-
 from mongorunway.application import event_manager
 from mongorunway.application import session
 from mongorunway.application import traits
@@ -49,46 +49,43 @@ if typing.TYPE_CHECKING:
     from mongorunway.domain import migration_event_manager as domain_event_manager
 
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("mongorunway.ui")
-try:
-    _P = typing.ParamSpec("_P")
-except AttributeError:
-    _P = typing_extensions.ParamSpec("_P")
-_TransactionCodeT = typing.TypeVar("_TransactionCodeT", bound=transactions.TransactionCode)
-
-
-def requires_migrations(
-    *,
-    is_applied: bool,
-) -> typing.Callable[
-    [typing.Callable[_P, _TransactionCodeT]], typing.Callable[_P, _TransactionCodeT]
-]:
-    def decorator(
-        meth: typing.Callable[_P, _TransactionCodeT],
-    ) -> typing.Callable[_P, _TransactionCodeT]:
-        @functools.wraps(meth)
-        def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _TransactionCodeT:
-            if not isinstance((self := args[0]), traits.MigrationSessionAware):
-                raise ValueError(
-                    f"'requires_migrations' can be applied only to "
-                    f"{traits.MigrationSessionAware!r} objects."
-                )
 
-            models = self.session.get_migration_models_by_flag(is_applied=is_applied)
-            if not models:
-                if self.session.raises_on_transaction_failure:
-                    if is_applied:
-                        raise domain_exception.NothingToDowngradeError()
-                    raise domain_exception.NothingToUpgradeError()
+if typing.TYPE_CHECKING:
+    _LoggerAdapter = logging.LoggerAdapter[logging.Logger]
+else:
+    _LoggerAdapter = logging.LoggerAdapter
 
-                return typing.cast(
-                    _TransactionCodeT,
-                    transactions.TRANSACTION_NOT_APPLIED,
-                )
-            return meth(*args, **kwargs)
 
-        return wrapper
+class _ApplicationLoggerAdapter(_LoggerAdapter):
+    # Prefixes records with the application name only once the level check
+    # has passed, and exposes the name to formatters as `%(app)s`.
+    def __init__(self, logger: logging.Logger, application_name: str) -> None:
+        super().__init__(logger, {"app": application_name})
+        self._prefix = f"{application_name}: "
 
-    return decorator
+    def process(
+        self,
+        msg: typing.Any,
+        kwargs: typing.MutableMapping[str, typing.Any],
+    ) -> typing.Tuple[typing.Any, typing.MutableMapping[str, typing.Any]]:
+        msg, kwargs = super().process(msg, kwargs)
+        return self._prefix + msg, kwargs
+
+
+def _batch_independent_migrations(
+    migrations: typing.Sequence[domain_migration.Migration], /
+) -> typing.List[typing.List[domain_migration.Migration]]:
+    # Greedily groups consecutive migrations that do not touch the same
+    # collections. Migrations without declared collections form their own
+    # batch, so they are still applied serially and in version order.
+    batches: typing.List[typing.List[domain_migration.Migration]] = []
+    for migration in migrations:
+        if batches and all(migration.is_independent_of(other) for other in batches[-1]):
+            batches[-1].append(migration)
+        else:
+            batches.append([migration])
+
+    return batches
 
 
 class MigrationApp(
@@ -177,6 +174,8 @@ class MigrationAppImpl(MigrationApp):
         "_session",
         "_event_manager",
         "_migration_service",
+        "_logger",
+        "_started",
     )
 
     def __init__(
@@ -188,16 +187,20 @@ class MigrationAppImpl(MigrationApp):
 
         self._session = app_session = session.MigrationSessionImpl(self, configuration)
         self._migration_service = migration_service.MigrationService(app_session)
+        self._logger = _ApplicationLoggerAdapter(_LOGGER, app_session.session_name)
 
         self._event_manager = event_manager.MigrationEventManagerImpl()
         for event_type, event_handlers in configuration.application.app_events.items():
             for handler in event_handlers:
                 self._event_manager.subscribe_event_handler(handler, event_type)
 
-        self._event_manager.dispatch(domain_event.StartingEvent(self))
+        # The starting event is dispatched lazily on first use, so creating an
+        # application does not pay for handlers that may perform I/O.
+        self._started = False
 
     def __del__(self) -> None:
-        self._event_manager.dispatch(domain_event.ClosingEvent(self))
+        if self._started:
+            self._event_manager.dispatch(domain_event.ClosingEvent(self))
 
     @property
     def name(self) -> str:
@@ -205,6 +208,7 @@ class MigrationAppImpl(MigrationApp):
 
     @property
     def session(self) -> session.MigrationSession:
+        self._ensure_started()
         return self._session
 
     @property
@@ -268,20 +272,27 @@ class MigrationAppImpl(MigrationApp):
     def dispatch(self, event: domain_event.MigrationEvent) -> None:
         return self._event_manager.dispatch(event)
 
-    @requires_migrations(is_applied=False)
+    def _ensure_started(self) -> None:
+        if not self._started:
+            # Set before dispatching, since handlers access the session.
+            self._started = True
+            self._event_manager.dispatch(domain_event.StartingEvent(self))
+
     def upgrade_once(self) -> int:
+        self._ensure_started()
         pending_migration_model = self._session.get_migration_model_by_flag(is_applied=False)
-        assert pending_migration_model is not None  # Only for type checkers
+        if pending_migration_model is None:
+            return self._nothing_to_upgrade()
 
         pending_migration = self._migration_service.get_migration(
             pending_migration_model.name,
             pending_migration_model.version,
+            is_applied=pending_migration_model.is_applied,
         )
 
         with self._session.begin_mongo_session() as session_context:
-            _LOGGER.info(
-                "%s: upgrading waiting migration (#%s -> #%s)...",
-                self.name,
+            self._logger.info(
+                "upgrading waiting migration (#%s -> #%s)...",
                 versioning_service.get_previous_migration_version(pending_migration),
                 pending_migration.version,
             )
@@ -292,27 +303,27 @@ class MigrationAppImpl(MigrationApp):
             ) as transaction:
                 transaction.apply_to(session_context)
 
-                _LOGGER.info(
-                    "%s: Successfully upgraded to (#%s).",
-                    self.name,
+                self._logger.info(
+                    "Successfully upgraded to (#%s).",
                     pending_migration.version,
                 )
                 return transactions.TRANSACTION_SUCCESS
 
-    @requires_migrations(is_applied=True)
     def downgrade_once(self) -> int:
+        self._ensure_started()
         applied_migration_model = self._session.get_migration_model_by_flag(is_applied=True)
-        assert applied_migration_model is not None  # Only for type checkers
+        if applied_migration_model is None:
+            return self._nothing_to_downgrade()
 
         applied_migration = self._migration_service.get_migration(
             applied_migration_model.name,
             applied_migration_model.version,
+            is_applied=applied_migration_model.is_applied,
         )
 
         with self._session.begin_mongo_session() as session_context:
-            _LOGGER.info(
-                "%s: downgrading waiting migration (#%s -> #%s)...",
-                self.name,
+            self._logger.info(
+                "downgrading waiting migration (#%s -> #%s)...",
                 applied_migration.version,
                 versioning_service.get_previous_migration_version(applied_migration),
             )
@@ -323,122 +334,270 @@ class MigrationAppImpl(MigrationApp):
             ) as transaction:
                 transaction.apply_to(session_context)
 
-                _LOGGER.info(
-                    "%s: successfully downgraded to (#%s).",
-                    self.name,
+                self._logger.info(
+                    "successfully downgraded to (#%s).",
                     versioning_service.get_previous_migration_version(applied_migration),
                 )
                 return transactions.TRANSACTION_SUCCESS
 
-    @requires_migrations(is_applied=False)
     def upgrade_while(
         self, predicate: typing.Callable[[domain_migration.Migration], bool], /
+    ) -> int:
+        self._ensure_started()
+        pending_migration_models = self._session.get_migration_models_by_flag(is_applied=False)
+        if not pending_migration_models:
+            return self._nothing_to_upgrade()
+
+        return self._upgrade_while(pending_migration_models, predicate)
+
+    def _upgrade_while(
+        self,
+        pending_migration_models: typing.Iterable[domain_migration.MigrationReadModel],
+        predicate: typing.Optional[typing.Callable[[domain_migration.Migration], bool]],
+        /,
     ) -> int:
         upgraded = 0
-        pending_migration_models = list(
-            self._session.get_migration_models_by_flag(is_applied=False)
+        pending_migration_models = sorted(
+            pending_migration_models, key=operator.attrgetter("version")
         )
-        pending_migration_models.sort(key=operator.attrgetter("version"))
+        transaction: typing.Optional[transactions.UpgradeTransaction] = None
 
-        with self._session.begin_mongo_session() as session_context:
-            while pending_migration_models:
-                migration = self._migration_service.get_migration(
-                    (model := pending_migration_models.pop(0)).name,
-                    model.version,
-                )
+        # Per-migration progress is only logged in debug mode, the whole run
+        # is summarized with a single line instead.
+        debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
+        first_migration: typing.Optional[domain_migration.Migration] = None
+        migration: typing.Optional[domain_migration.Migration] = None
 
-                if not predicate(migration):
-                    break
+        migrations = self._iter_migrations(pending_migration_models)
+        if predicate is not None:
+            migrations = itertools.takewhile(predicate, migrations)
 
-                _LOGGER.info(
-                    "%s: upgrading waiting migration (#%s -> #%s)...",
-                    self.name,
-                    versioning_service.get_previous_migration_version(migration),
-                    migration.version,
-                )
+        with self._session.begin_mongo_session() as session_context:
+            for migration in migrations:
+                if debug_enabled:
+                    self._logger.debug(
+                        "upgrading waiting migration (#%s -> #%s)...",
+                        versioning_service.get_previous_migration_version(migration),
+                        migration.version,
+                    )
 
                 with self._session.begin_transaction(
-                    transactions.UpgradeTransaction,
+                    transaction or transactions.UpgradeTransaction,
                     migration=migration,
                 ) as transaction:
                     transaction.apply_to(session_context)
 
-                _LOGGER.info(
-                    "%s: Successfully upgraded to (#%s).",
-                    self.name,
-                    migration.version,
-                )
+                if debug_enabled:
+                    self._logger.debug(
+                        "Successfully upgraded to (#%s).",
+                        migration.version,
+                    )
+                first_migration = first_migration or migration
                 upgraded += 1
 
-            return upgraded
+        if first_migration is not None and migration is not None:
+            self._logger.info(
+                "Successfully upgraded %s migration(s) (#%s -> #%s).",
+                upgraded,
+                versioning_service.get_previous_migration_version(first_migration),
+                migration.version,
+            )
+
+        return upgraded
 
-    @requires_migrations(is_applied=True)
     def downgrade_while(
         self, predicate: typing.Callable[[domain_migration.Migration], bool], /
+    ) -> int:
+        self._ensure_started()
+        applied_migration_models = self._session.get_migration_models_by_flag(is_applied=True)
+        if not applied_migration_models:
+            return self._nothing_to_downgrade()
+
+        return self._downgrade_while(applied_migration_models, predicate)
+
+    def _downgrade_while(
+        self,
+        applied_migration_models: typing.Iterable[domain_migration.MigrationReadModel],
+        predicate: typing.Optional[typing.Callable[[domain_migration.Migration], bool]],
+        /,
     ) -> int:
         downgraded = 0
-        applied_migration_models = list(
-            self._session.get_migration_models_by_flag(is_applied=True)
+        applied_migration_models = sorted(
+            applied_migration_models, key=operator.attrgetter("version"), reverse=True
         )
-        applied_migration_models.sort(key=operator.attrgetter("version"), reverse=True)
+        transaction: typing.Optional[transactions.DowngradeTransaction] = None
 
-        with self._session.begin_mongo_session() as session_context:
-            while applied_migration_models:
-                migration = self._migration_service.get_migration(
-                    (model := applied_migration_models.pop(0)).name,
-                    model.version,
-                )
+        debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
+        first_migration: typing.Optional[domain_migration.Migration] = None
+        migration: typing.Optional[domain_migration.Migration] = None
 
-                if not predicate(migration):
-                    break
+        migrations = self._iter_migrations(applied_migration_models)
+        if predicate is not None:
+            migrations = itertools.takewhile(predicate, migrations)
 
-                _LOGGER.info(
-                    "%s: downgrading waiting migration (#%s -> #%s)...",
-                    self.name,
-                    migration.version,
-                    versioning_service.get_previous_migration_version(migration),
-                )
+        with self._session.begin_mongo_session() as session_context:
+            for migration in migrations:
+                if debug_enabled:
+                    self._logger.debug(
+                        "downgrading waiting migration (#%s -> #%s)...",
+                        migration.version,
+                        versioning_service.get_previous_migration_version(migration),
+                    )
 
                 with self._session.begin_transaction(
-                    transactions.DowngradeTransaction,
+                    transaction or transactions.DowngradeTransaction,
                     migration=migration,
                 ) as transaction:
                     transaction.apply_to(session_context)
 
-                _LOGGER.info(
-                    "%s: successfully downgraded to (#%s).",
-                    self.name,
-                    versioning_service.get_previous_migration_version(migration),
-                )
+                if debug_enabled:
+                    self._logger.debug(
+                        "successfully downgraded to (#%s).",
+                        versioning_service.get_previous_migration_version(migration),
+                    )
+                first_migration = first_migration or migration
                 downgraded += 1
 
-            return downgraded
+        if first_migration is not None and migration is not None:
+            self._logger.info(
+                "successfully downgraded %s migration(s) (#%s -> #%s).",
+                downgraded,
+                first_migration.version,
+                versioning_service.get_previous_migration_version(migration),
+            )
+
+        return downgraded
+
+    def _iter_migrations(
+        self,
+        migration_models: typing.Iterable[domain_migration.MigrationReadModel],
+        /,
+    ) -> typing.Iterator[domain_migration.Migration]:
+        # Lazily loads migration files, so that a `*_while` predicate scan
+        # stops importing them at the first migration that fails it.
+        for model in migration_models:
+            yield self._migration_service.get_migration(
+                model.name,
+                model.version,
+                is_applied=model.is_applied,
+            )
 
     def downgrade_to(self, migration_version: int, /) -> int:
         if not migration_version:
             return self.downgrade_all()
 
-        model = self.session.get_migration_model_by_version(migration_version)
-        if model is None:
-            raise ValueError(f"Migration with version {migration_version!r} is not found.")
+        # The applied models are fetched once and reused both for the version
+        # check and for the downgrade itself.
+        applied_migration_models = self.session.get_migration_models_by_flag(is_applied=True)
+        if migration_version not in {model.version for model in applied_migration_models}:
+            if not self._session.has_migration_with_version(migration_version):
+                raise ValueError(f"Migration with version {migration_version!r} is not found.")
 
-        if not model.is_applied:
             raise ValueError(f"Migration with version {migration_version} is already pending.")
 
-        return self.downgrade_while(lambda m: m.version > migration_version)
+        # Version bounds are applied to the models, so no predicate has to be
+        # called and no migration module beyond the target is loaded.
+        return self._downgrade_while(
+            [model for model in applied_migration_models if model.version > migration_version],
+            None,
+        )
 
     def upgrade_to(self, migration_version: int, /) -> int:
-        model = self.session.get_migration_model_by_version(migration_version)
-        if model is None:
-            raise ValueError(f"Migration with version {migration_version!r} is not found.")
+        pending_migration_models = self.session.get_migration_models_by_flag(is_applied=False)
+        if migration_version not in {model.version for model in pending_migration_models}:
+            if not self._session.has_migration_with_version(migration_version):
+                raise ValueError(f"Migration with version {migration_version!r} is not found.")
 
-        if model.is_applied:
             raise ValueError(f"Migration with version {migration_version} is already applied.")
 
-        return self.upgrade_while(lambda m: m.version <= migration_version)
+        return self._upgrade_while(
+            [model for model in pending_migration_models if model.version <= migration_version],
+            None,
+        )
 
     def downgrade_all(self) -> int:
-        return self.downgrade_while(lambda _: True)
+        self._ensure_started()
+        applied_migration_models = self._session.get_migration_models_by_flag(is_applied=True)
+        if not applied_migration_models:
+            return self._nothing_to_downgrade()
+
+        return self._downgrade_while(applied_migration_models, None)
 
     def upgrade_all(self) -> int:
-        return self.upgrade_while(lambda _: True)
+        self._ensure_started()
+        pending_migration_models = self._session.get_migration_models_by_flag(is_applied=False)
+        if not pending_migration_models:
+            return self._nothing_to_upgrade()
+
+        return self._upgrade_while(pending_migration_models, None)
+
+    async def upgrade_all_async(self) -> int:
+        upgraded = 0
+        loop = asyncio.get_running_loop()
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            # Starting the application, querying the repository and importing
+            # the migration modules all block, so they run in the executor too.
+            pending_migrations = await loop.run_in_executor(executor, self._get_pending_migrations)
+            if not pending_migrations:
+                return self._nothing_to_upgrade()
+
+            for batch in _batch_independent_migrations(pending_migrations):
+                await asyncio.gather(
+                    *(
+                        loop.run_in_executor(executor, self._upgrade_in_own_session, migration)
+                        for migration in batch
+                    )
+                )
+                # Like `upgrade_all`, a failed transaction does not stop the run.
+                upgraded += len(batch)
+
+        return upgraded
+
+    def _get_pending_migrations(self) -> typing.List[domain_migration.Migration]:
+        self._ensure_started()
+        pending_migration_models = list(
+            self._session.get_migration_models_by_flag(is_applied=False)
+        )
+        pending_migration_models.sort(key=operator.attrgetter("version"))
+        return [
+            self._migration_service.get_migration(
+                model.name,
+                model.version,
+                is_applied=model.is_applied,
+            )
+            for model in pending_migration_models
+        ]
+
+    def _nothing_to_upgrade(self) -> int:
+        if self._session.raises_on_transaction_failure:
+            raise domain_exception.NothingToUpgradeError()
+
+        return transactions.TRANSACTION_NOT_APPLIED
+
+    def _nothing_to_downgrade(self) -> int:
+        if self._session.raises_on_transaction_failure:
+            raise domain_exception.NothingToDowngradeError()
+
+        return transactions.TRANSACTION_NOT_APPLIED
+
+    def _upgrade_in_own_session(self, migration: domain_migration.Migration, /) -> None:
+        # MongoDB sessions are not thread-safe, so every concurrently
+        # applied migration gets a session of its own.
+        with self._session.begin_mongo_session() as session_context:
+            self._logger.info(
+                "upgrading waiting migration (#%s -> #%s)...",
+                versioning_service.get_previous_migration_version(migration),
+                migration.version,
+            )
+
+            with self._session.begin_transaction(
+                transactions.UpgradeTransaction,
+                migration=migration,
+            ) as transaction:
+                transaction.apply_to(session_context)
+
+            if not transaction.is_failed():
+                self._logger.info(
+                    "Successfully upgraded to (#%s).",
+                    migration.version,
+                )
@@ -23,15 +23,66 @@ from __future__ import annotations
 __all__: typing.Sequence[str] = ("MigrationEventManagerImpl",)
 
 import collections
-import heapq
 import inspect
 import operator
 import typing
+import weakref
 
 from mongorunway.domain import migration_event as domain_event
 from mongorunway.domain import migration_event_manager as domain_event_manager
 
 
+# The signature of a handler never changes, so it is only parsed once, even
+# when the handler is registered in several applications. The cache is keyed
+# on the underlying function and holds it weakly, so neither handlers nor the
+# instances of bound method handlers are kept alive by it.
+_annotated_events: weakref.WeakKeyDictionary[
+    typing.Callable[..., typing.Any], typing.Tuple[typing.Type[domain_event.MigrationEvent], ...]
+] = weakref.WeakKeyDictionary()
+
+
+def _get_annotated_events(
+    handler_func: domain_event.EventHandler,
+    /,
+) -> typing.Tuple[typing.Type[domain_event.MigrationEvent], ...]:
+    func = getattr(handler_func, "__func__", handler_func)
+    try:
+        return _annotated_events[func]
+    except (KeyError, TypeError):  # TypeError: unhashable or not weak-referenceable
+        pass
+
+    annotated_events = _read_annotated_events(func)
+    try:
+        _annotated_events[func] = annotated_events
+    except TypeError:
+        pass
+
+    return annotated_events
+
+
+def _read_annotated_events(
+    func: typing.Callable[..., typing.Any],
+    /,
+) -> typing.Tuple[typing.Type[domain_event.MigrationEvent], ...]:
+    annotation: typing.Any = inspect.Parameter.empty
+    if inspect.isfunction(unwrapped := inspect.unwrap(func)):
+        # Resolves string annotations in the namespace the function was defined
+        # in, without building the Signature and Parameter objects.
+        annotation = typing.get_type_hints(unwrapped).get("event", annotation)
+    else:
+        signature = inspect.signature(func, eval_str=True)
+        if (parameter := signature.parameters.get("event")) is not None:
+            annotation = parameter.annotation
+
+    if annotation is inspect.Parameter.empty:
+        raise ValueError("Handler missing 'event' parameter or parameter annotation.")
+
+    if typing.get_origin(annotation) is typing.Union:
+        return typing.get_args(annotation)
+
+    return (annotation,)
+
+
 class MigrationEventManagerImpl(domain_event_manager.MigrationEventManager):
     __slots__: typing.Sequence[str] = ("_event_dict", "_event_cond")
 
@@ -128,21 +179,7 @@ class MigrationEventManagerImpl(domain_event_manager.MigrationEventManager):
                 )
 
             if not events:
-                signature = inspect.signature(handler_func, eval_str=True)
-                try:
-                    parameter = signature.parameters["event"]
-                    if parameter.annotation is inspect.Parameter.empty:
-                        raise
-                except KeyError as exc:
-                    raise ValueError(
-                        f"Handler missing 'event' parameter or parameter annotation."
-                    ) from exc
-
-                if typing.get_origin(parameter.annotation) is typing.Union:
-                    self.subscribe_events(handler, *typing.get_args(parameter.annotation))
-                    return handler
-
-                self.subscribe_events(handler, parameter.annotation)
+                self.subscribe_events(handler, *_get_annotated_events(handler_func))
                 return handler
 
             self.subscribe_events(handler, *events)
@@ -151,21 +188,26 @@ class MigrationEventManagerImpl(domain_event_manager.MigrationEventManager):
         return decorator
 
     def dispatch(self, event: domain_event.MigrationEvent) -> None:
-        handlers = self.get_event_handlers_for(type(event))
+        # Most events have no subscribers, and looking them up through the
+        # defaultdict would also store an empty handler list for each of them.
+        handlers = self._event_dict.get(type(event))
+        if not handlers:
+            return
+
         prioritized_handlers = []
         unprioritized_handlers = []
+        handler_proxy_type = domain_event.EventHandlerProxy
 
         for handler in handlers:
-            if isinstance(handler, domain_event.EventHandlerProxy):
+            if isinstance(handler, handler_proxy_type):
                 prioritized_handlers.append(handler)
             else:
                 unprioritized_handlers.append(handler)
 
+        # The sort is stable, so handlers with equal priorities keep their
+        # subscription order.
         prioritized_handlers.sort(key=operator.attrgetter("priority"))
-        heapq.heapify(prioritized_handlers)
-
-        while prioritized_handlers:
-            proxy = heapq.heappop(prioritized_handlers)
+        for proxy in prioritized_handlers:
             proxy.handler(event)
 
         for handler in unprioritized_handlers:
@@ -29,6 +29,10 @@ import typing
 class FilenameStrategy(abc.ABC):
     __slots__: typing.Sequence[str] = ()
 
+    # Strategies that never change the filename set this, so that callers
+    # can skip `transform_migration_filename` entirely.
+    IS_NOOP: typing.ClassVar[bool] = False
+
     @abc.abstractmethod
     def is_valid_filename(self, filename: str, /) -> bool:
         ...
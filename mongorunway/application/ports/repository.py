@@ -83,10 +83,27 @@ class MigrationModelRepository(abc.ABC):
     def append_migration(self, migration: domain_migration.Migration, /) -> int:
         ...
 
+    def append_migrations(
+        self,
+        migrations: typing.Sequence[domain_migration.Migration],
+        /,
+    ) -> typing.Sequence[int]:
+        return [self.append_migration(migration) for migration in migrations]
+
+    def acquire_migration_versions(self) -> typing.FrozenSet[int]:
+        return frozenset(model.version for model in self.acquire_all_migration_models())
+
     @abc.abstractmethod
     def remove_migration(self, migration_version: int, /) -> int:
         ...
 
+    def remove_migrations(
+        self,
+        migration_versions: typing.Sequence[int],
+        /,
+    ) -> typing.Sequence[int]:
+        return [self.remove_migration(version) for version in migration_versions]
+
     @abc.abstractmethod
     def set_applied_flag(self, migration: domain_migration.Migration, is_applied: bool) -> int:
         ...
@@ -20,7 +20,10 @@
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("calculate_migration_checksum",)
+__all__: typing.Sequence[str] = (
+    "calculate_migration_checksum",
+    "calculate_file_checksum",
+)
 
 import hashlib
 import typing
@@ -30,6 +33,10 @@ if typing.TYPE_CHECKING:
 
 
 def calculate_migration_checksum(module: domain_module.MigrationBusinessModule, /) -> str:
-    with open(module.location, "r") as f:
+    return calculate_file_checksum(module.location)
+
+
+def calculate_file_checksum(path: str, /) -> str:
+    with open(path, "r") as f:
         file_data = f.read().encode()
         return hashlib.md5(file_data).hexdigest()
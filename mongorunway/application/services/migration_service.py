@@ -25,9 +25,12 @@ __all__: typing.Sequence[str] = (
     "MigrationService",
 )
 
+import operator
 import os
 import string
+import types
 import typing
+import weakref
 
 from mongorunway import util
 from mongorunway.application import config
@@ -49,6 +52,10 @@ import mongorunway
 # Required, used by Mongorunway.
 version = $version
 
+# Optional, the collections changed by this migration. Pending migrations
+# with disjoint `touches` may be applied concurrently by `upgrade_all_async`.
+# touches = {"collection_name"}
+
 
 @mongorunway.migration
 def upgrade() -> typing.Sequence[mongorunway.MigrationCommand]:
@@ -62,6 +69,48 @@ def downgrade() -> typing.Sequence[mongorunway.MigrationCommand]:
 )
 
 
+# New templates never contain commands, so only the version is left to fill in.
+_template_prefix, _template_suffix = migration_file_template.safe_substitute(
+    upgrade_commands=[],
+    downgrade_commands=[],
+).split("$version")
+
+
+# The processes of a business module are created when its module is executed,
+# so the wrapper is reused for as long as `util.get_module` returns the same
+# module object.
+_business_modules: weakref.WeakKeyDictionary[
+    types.ModuleType, domain_module.MigrationBusinessModule
+] = weakref.WeakKeyDictionary()
+
+
+def _get_business_module(module: types.ModuleType, /) -> domain_module.MigrationBusinessModule:
+    try:
+        return _business_modules[module]
+    except KeyError:
+        migration_module = domain_module.MigrationBusinessModule(module)
+        _business_modules[module] = migration_module
+        return migration_module
+
+
+# A module object is only replaced once its file changes, so the checksum of
+# its file is computed once per module object as well.
+_module_checksums: weakref.WeakKeyDictionary[types.ModuleType, str] = weakref.WeakKeyDictionary()
+
+
+def _get_module_checksum(
+    module: types.ModuleType,
+    migration_module: domain_module.MigrationBusinessModule,
+    /,
+) -> str:
+    try:
+        return _module_checksums[module]
+    except KeyError:
+        checksum = checksum_service.calculate_migration_checksum(migration_module)
+        _module_checksums[module] = checksum
+        return checksum
+
+
 class MigrationService:
     def __init__(self, app_session: session.MigrationSession) -> None:
         self._session = app_session
@@ -70,100 +119,174 @@ class MigrationService:
         self,
         migration_name: str,
         migration_version: int,
+        *,
+        is_applied: typing.Optional[bool] = None,
     ) -> domain_migration.Migration:
-        if self._session.uses_strict_file_naming:
-            strategy = self._session.session_file_naming_strategy
+        module = self._get_migration_module(migration_name, migration_version)
+
+        if is_applied is None:
+            # Callers that already hold the stored model pass its flag, so that
+            # loading many migrations does not query the repository per migration.
+            model = self._session.get_migration_model_by_version(module.version)
+            is_applied = False if model is None else model.is_applied
+
+        return self._build_migration(module, is_applied)
+
+    def get_migration_checksum(self, migration_name: str, migration_version: int) -> str:
+        # Only hashes the file, the module is not loaded and the repository
+        # is not queried, which is all that checksum comparisons need.
+        strategy = self._session.session_file_naming_strategy
+        if self._session.uses_strict_file_naming and not strategy.IS_NOOP:
             migration_name = strategy.transform_migration_filename(
                 migration_name,
                 migration_version,
             )
 
-        module = util.get_module(self._session.session_scripts_dir, migration_name)
-        migration_module = domain_module.MigrationBusinessModule(module)
+        if not migration_name.endswith(".py"):
+            migration_name += ".py"
+
+        path = os.path.join(self._session.session_scripts_dir, migration_name)
+        try:
+            return checksum_service.calculate_file_checksum(path)
+        except FileNotFoundError:
+            raise ModuleNotFoundError(f"Module {path!r} is not found.")
+
+    def get_migrations(self) -> typing.Sequence[domain_migration.Migration]:
+        modules = self._load_migration_modules(self._scan_scripts_dir())
+
+        # The applied flags of all migrations are read with a single query.
+        applied_versions = self._get_applied_versions()
+        return [
+            self._build_migration(module, module.version in applied_versions) for module in modules
+        ]
+
+    def _scan_scripts_dir(self) -> typing.List[os.DirEntry[str]]:
+        # Entries cache their file type, so filtering them needs no extra stat calls.
+        with os.scandir(self._session.session_scripts_dir) as entries:
+            return sorted(entries, key=operator.attrgetter("name"))
+
+    def _list_migration_filenames(self) -> typing.List[str]:
+        return [
+            entry.name for entry in self._scan_scripts_dir() if util.is_valid_file_entry(entry)
+        ]
+
+    def _get_migration_module(
+        self,
+        migration_name: str,
+        migration_version: int,
+        /,
+    ) -> types.ModuleType:
+        strategy = self._session.session_file_naming_strategy
+        if self._session.uses_strict_file_naming and not strategy.IS_NOOP:
+            migration_name = strategy.transform_migration_filename(
+                migration_name,
+                migration_version,
+            )
 
-        model = self._session.get_migration_model_by_version(module.version)
+        return util.get_module(self._session.session_scripts_dir, migration_name)
 
-        migration = domain_migration.Migration(
+    @staticmethod
+    def _build_migration(
+        module: types.ModuleType,
+        is_applied: bool,
+        /,
+    ) -> domain_migration.Migration:
+        migration_module = _get_business_module(module)
+        return domain_migration.Migration(
             name=migration_module.get_name(),
             version=module.version,
             description=migration_module.description,
-            checksum=checksum_service.calculate_migration_checksum(migration_module),
+            checksum=_get_module_checksum(module, migration_module),
             downgrade_process=migration_module.downgrade_process,
             upgrade_process=migration_module.upgrade_process,
-            is_applied=False if model is None else model.is_applied,
+            is_applied=is_applied,
+            touches=migration_module.touches,
         )
 
-        return migration
+    def _get_applied_versions(self) -> typing.Set[int]:
+        return {
+            model.version for model in self._session.get_migration_models_by_flag(is_applied=True)
+        }
 
-    @typing.no_type_check
-    def get_migrations(self) -> typing.Sequence[domain_migration.Migration]:
+    def _load_migration_modules(
+        self,
+        script_entries: typing.Sequence[os.DirEntry[str]],
+        /,
+    ) -> typing.Sequence[types.ModuleType]:
         filename_strategy = self._session.session_file_naming_strategy
-        directory = self._session.session_scripts_dir
-
         if self._session.uses_strict_file_naming:
+            transform = (
+                None
+                if filename_strategy.IS_NOOP
+                else filename_strategy.transform_migration_filename
+            )
             # All migrations are in the correct order by name.
             return [
-                self.get_migration(
-                    filename_strategy.transform_migration_filename(migration_name, position),
+                self._get_migration_module(
+                    entry.name if transform is None else transform(entry.name, position),
                     position,
                 )
-                for position, migration_name in enumerate(
-                    sorted(os.listdir(directory)),
-                    config.VERSIONING_STARTS_FROM,
-                )
-                if util.is_valid_filename(directory, migration_name)
+                for position, entry in enumerate(script_entries, config.VERSIONING_STARTS_FROM)
+                if util.is_valid_file_entry(entry)
             ]
 
         else:
-            migrations: typing.Dict[int, domain_migration.Migration] = {}
-            for migration_name in sorted(os.listdir(directory)):
-                if not util.is_valid_filename(directory, migration_name):
-                    continue
-
-                module = util.get_module(directory, migration_name)
-                try:
-                    migration_version = module.version
-                except AttributeError:
-                    raise ImportError(
-                        f"Migration {migration_name} in non-strict mode must have "
-                        f"'version' variable."
-                    )
-
-                migrations[migration_version] = self.get_migration(
-                    migration_name,
-                    migration_version,
-                )
+            # Every module has to be imported to learn its version.
+            versioned_modules = [
+                self._load_non_strict_module(entry.name)
+                for entry in script_entries
+                if util.is_valid_file_entry(entry)
+            ]
 
-            if (start := config.VERSIONING_STARTS_FROM) not in migrations:
+            versioned_modules.sort(key=operator.itemgetter(0))
+            start = config.VERSIONING_STARTS_FROM
+            if not versioned_modules or versioned_modules[0][0] != start:
                 # ...
                 raise ValueError(f"Versioning starts from {start}.")
 
-            return [migrations[key] for key in sorted(migrations.keys())]
+            return [module for _, module in versioned_modules]
+
+    def _load_non_strict_module(
+        self,
+        migration_name: str,
+        /,
+    ) -> typing.Tuple[int, types.ModuleType]:
+        module = util.get_module(self._session.session_scripts_dir, migration_name)
+        try:
+            migration_version = module.version
+        except AttributeError:
+            raise ImportError(
+                f"Migration {migration_name} in non-strict mode must have 'version' variable."
+            )
+
+        return migration_version, module
 
     def create_migration_file_template(
         self,
         migration_filename: str,
         migration_version: typing.Optional[int] = None,
     ) -> None:
-        migrations = self.get_migrations()
+        # Only the number of scripts matters here, so nothing has to be imported.
+        migrations_count = len(self._list_migration_filenames())
         if migration_version is None:
-            migration_version = len(migrations) + 1
+            migration_version = migrations_count + 1
 
         if self._session.has_migration_with_version(migration_version):
             raise ValueError(f"Migration with version {migration_version} already exist.")
 
-        if abs(len(migrations) - migration_version) > 1:
+        if abs(migrations_count - migration_version) > 1:
             raise ValueError(
                 f"Versions of migrations must be consistent: the next version "
-                f"must be {len(migrations) + 1!r}, but {migration_version!r} received."
+                f"must be {migrations_count + 1!r}, but {migration_version!r} received."
             )
 
         filename_strategy = self._session.session_file_naming_strategy
         if self._session.uses_strict_file_naming:
-            migration_filename = filename_strategy.transform_migration_filename(
-                migration_filename,
-                migration_version,
-            )
+            if not filename_strategy.IS_NOOP:
+                migration_filename = filename_strategy.transform_migration_filename(
+                    migration_filename,
+                    migration_version,
+                )
 
             if not migration_filename.endswith(".py"):
                 migration_filename += ".py"
@@ -175,12 +298,6 @@ class MigrationService:
             ),
             "w",
         ) as file:
-            file.write(
-                migration_file_template.safe_substitute(
-                    version=migration_version,
-                    upgrade_commands=[],
-                    downgrade_commands=[],
-                )
-            )
+            file.write(f"{_template_prefix}{migration_version}{_template_suffix}")
 
         return None
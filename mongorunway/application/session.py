@@ -79,13 +79,28 @@ def requires_auditlog(meth: typing.Callable[_P, _T]) -> typing.Callable[_P, _T]:
 
 
 class TransactionContext(typing.Generic[TransactionT]):
+    __slots__: typing.Sequence[str] = (
+        "_transaction",
+        "_migration",
+        "_migration_session",
+    )
+
     def __init__(
         self,
         migration_session: MigrationSession,
-        transaction_type: typing.Type[TransactionT],
+        transaction: typing.Union[typing.Type[TransactionT], TransactionT],
         migration: domain_migration.Migration,
     ) -> None:
-        self._transaction = transaction_type.create(migration_session, migration)
+        if isinstance(transaction, type):
+            self._transaction = transaction.create(migration_session, migration)
+        else:
+            try:
+                transaction.reset(migration)
+            except NotImplementedError:
+                transaction = transaction.create(migration_session, migration)
+
+            self._transaction = transaction
+
         self._migration = migration
         self._migration_session = migration_session
 
@@ -120,6 +135,8 @@ class TransactionContext(typing.Generic[TransactionT]):
 
 class MongoSessionContext:
     # incapsulate
+    __slots__: typing.Sequence[str] = ("__session",)
+
     def __init__(self, session: mongo.ClientSession) -> None:
         self.__session = session
 
@@ -307,10 +324,22 @@ class MigrationSession(abc.ABC):
     def append_migration(self, migration: domain_migration.Migration, /) -> None:
         ...
 
+    @abc.abstractmethod
+    def append_missing_migrations(
+        self,
+        migrations: typing.Iterable[domain_migration.Migration],
+        /,
+    ) -> typing.Sequence[domain_migration.Migration]:
+        ...
+
     @abc.abstractmethod
     def remove_migration(self, migration_version: int, /) -> None:
         ...
 
+    @abc.abstractmethod
+    def remove_migrations(self, migration_versions: typing.Sequence[int], /) -> None:
+        ...
+
     @abc.abstractmethod
     def get_current_version(self) -> typing.Optional[int]:
         ...
@@ -332,7 +361,7 @@ class MigrationSession(abc.ABC):
     @abc.abstractmethod
     def begin_transaction(
         self,
-        transaction_type: typing.Type[TransactionT],
+        transaction: typing.Union[typing.Type[TransactionT], TransactionT],
         migration: domain_migration.Migration,
     ) -> TransactionContext[TransactionT]:
         ...
@@ -485,6 +514,27 @@ class MigrationSessionImpl(MigrationSession):
 
         self._repository.append_migration(migration)
 
+    def append_missing_migrations(
+        self,
+        migrations: typing.Iterable[domain_migration.Migration],
+        /,
+    ) -> typing.Sequence[domain_migration.Migration]:
+        # One query for the stored versions instead of a lookup per migration.
+        stored_versions = self._repository.acquire_migration_versions()
+
+        missing_migrations = []
+        for migration in migrations:
+            if not isinstance(migration, domain_migration.Migration):
+                raise TypeError(f"Migration must be instance of {domain_migration.Migration!r}.")
+
+            if migration.version not in stored_versions:
+                missing_migrations.append(migration)
+
+        if missing_migrations:
+            self._repository.append_migrations(missing_migrations)
+
+        return missing_migrations
+
     def remove_migration(self, migration_version: int, /) -> None:
         if not isinstance(migration_version, int):
             raise TypeError(f"Migration version must be instance of {int!r}.")
@@ -495,6 +545,20 @@ class MigrationSessionImpl(MigrationSession):
 
         self._repository.remove_migration(migration_version)
 
+    def remove_migrations(self, migration_versions: typing.Sequence[int], /) -> None:
+        for migration_version in migration_versions:
+            if not isinstance(migration_version, int):
+                raise TypeError(f"Migration version must be instance of {int!r}.")
+
+        # One query for the stored versions instead of a lookup per migration.
+        stored_versions = self._repository.acquire_migration_versions()
+        for migration_version in migration_versions:
+            if migration_version not in stored_versions:
+                raise ValueError(f"Migration with version {migration_version} does not exist.")
+
+        if migration_versions:
+            self._repository.remove_migrations(migration_versions)
+
     def set_applied_flag(self, migration: domain_migration.Migration, is_applied: bool) -> None:
         if not isinstance(migration, domain_migration.Migration):
             raise TypeError(f"Migration must be instance of {domain_migration.Migration!r}.")
@@ -538,10 +602,10 @@ class MigrationSessionImpl(MigrationSession):
 
     def begin_transaction(
         self,
-        transaction_type: typing.Type[TransactionT],
+        transaction: typing.Union[typing.Type[TransactionT], TransactionT],
         migration: domain_migration.Migration,
     ) -> TransactionContext[TransactionT]:
-        ctx = TransactionContext(self, transaction_type, migration)
+        ctx = TransactionContext(self, transaction, migration)
         _LOGGER.info(
             "Mongorunway transaction context successfully initialized "
             "with Mongorunway session id (%s)",
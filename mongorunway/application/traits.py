@@ -27,6 +27,7 @@ __all__: typing.Sequence[str] = (
 )
 
 import abc
+import asyncio
 import typing
 
 if typing.TYPE_CHECKING:
@@ -87,3 +88,8 @@ class MigrationRunner(abc.ABC):
     @abc.abstractmethod
     def upgrade_all(self) -> int:
         ...
+
+    async def upgrade_all_async(self) -> int:
+        # Runners without concurrent support apply all migrations serially,
+        # without blocking the event loop.
+        return await asyncio.to_thread(self.upgrade_all)
@@ -30,11 +30,17 @@ __all__: typing.Sequence[str] = (
     "DowngradeTransaction",
     "TRANSACTION_SUCCESS",
     "TRANSACTION_NOT_APPLIED",
+    "MAX_BATCH",
 )
 
 import abc
+import itertools
 import logging
+import threading
 import typing
+import weakref
+
+from pymongo import errors
 
 from mongorunway import util
 from mongorunway.application import session
@@ -43,6 +49,8 @@ from mongorunway.domain import migration_context as domain_context
 
 if typing.TYPE_CHECKING:
     from mongorunway.domain import migration as domain_migration
+    from mongorunway import mongo
+    from mongorunway.domain import migration_command as domain_command
 
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("mongorunway.transactions")
 _SelfT = typing.TypeVar("_SelfT", bound="MigrationTransaction")
@@ -53,6 +61,83 @@ TRANSACTION_SUCCESS: typing.Final[TransactionCode] = 1
 
 TRANSACTION_NOT_APPLIED: typing.Final[TransactionCode] = 0
 
+# Write batch size assumed until the server reports its `maxWriteBatchSize`.
+MAX_BATCH: typing.Final[int] = 1000
+
+_max_batch_sizes: weakref.WeakKeyDictionary[mongo.Client, int] = weakref.WeakKeyDictionary()
+# Transactions of independent migrations may run in several threads at once.
+_max_batch_sizes_lock = threading.Lock()
+
+
+class _CommandBatch(typing.NamedTuple):
+    # None for a single command that cannot be sent as a bulk operation.
+    collection: typing.Optional[str]
+    commands: typing.List[domain_command.AnyCommand]
+    operations: typing.List[typing.Any]
+
+
+def _group_bulk_commands(
+    commands: domain_command.AnyCommandSequence,
+) -> typing.Iterator[_CommandBatch]:
+    # Consecutive write commands targeting the same collection are grouped
+    # together; every other command forms a batch of its own.
+    batch: typing.Optional[_CommandBatch] = None
+    for command in commands:
+        bulk_ops = command.bulk_ops()
+        if bulk_ops is None:
+            if batch is not None:
+                yield batch
+                batch = None
+
+            yield _CommandBatch(None, [command], [])
+            continue
+
+        collection, operations = bulk_ops
+        if batch is not None and batch.collection != collection:
+            yield batch
+            batch = None
+
+        if batch is None:
+            batch = _CommandBatch(collection, [], [])
+
+        batch.commands.append(command)
+        batch.operations.extend(operations)
+
+    if batch is not None:
+        yield batch
+
+
+def _execute_batch(batch: _CommandBatch, context: domain_context.MigrationContext) -> None:
+    if batch.collection is None or len(batch.commands) == 1:
+        batch.commands[0].execute(context)
+        return None
+
+    # Operations are pre-split to the server batch size, so that pymongo
+    # does not have to re-split one oversized bulk. Ordered, so the commands
+    # keep their sequential semantics.
+    collection = context.get_collection(batch.collection)
+    max_batch_size = _get_max_batch_size(context.client)
+    operations = iter(batch.operations)
+    while chunk := list(itertools.islice(operations, max_batch_size)):
+        collection.bulk_write(chunk, ordered=True)
+
+
+def _get_max_batch_size(client: mongo.Client) -> int:
+    with _max_batch_sizes_lock:
+        if (max_batch_size := _max_batch_sizes.get(client)) is not None:
+            return max_batch_size
+
+    try:
+        hello: typing.Mapping[str, typing.Any] = client.admin.command("hello")
+        max_batch_size = int(hello.get("maxWriteBatchSize", MAX_BATCH))
+    except errors.PyMongoError:
+        # Servers that do not support `hello`.
+        max_batch_size = MAX_BATCH
+
+    with _max_batch_sizes_lock:
+        _max_batch_sizes[client] = max_batch_size
+    return max_batch_size
+
 
 class MigrationTransaction(abc.ABC):
     __slots__: typing.Sequence[str] = ()
@@ -75,6 +160,11 @@ class MigrationTransaction(abc.ABC):
     def is_failed(self) -> bool:
         ...
 
+    def reset(self, migration: domain_migration.Migration, /) -> None:
+        # Transactions that cannot be retargeted at another migration are
+        # created anew by the transaction context instead.
+        raise NotImplementedError
+
     @abc.abstractmethod
     def get_process(
         self, migration: domain_migration.Migration, /
@@ -103,6 +193,13 @@ class MigrationTransaction(abc.ABC):
 
 
 class AbstractMigrationTransaction(MigrationTransaction, abc.ABC):
+    __slots__: typing.Sequence[str] = (
+        "_client",
+        "_migration_session",
+        "_migration",
+        "_exc_val",
+    )
+
     def __init__(
         self,
         migration_session: session.MigrationSession,
@@ -128,6 +225,12 @@ class AbstractMigrationTransaction(MigrationTransaction, abc.ABC):
     def is_failed(self) -> bool:
         return self.exc_val is not None
 
+    def reset(self, migration: domain_migration.Migration, /) -> None:
+        # Allows a single transaction object to be reused across the
+        # migrations of one `*_while` run instead of allocating a new one.
+        self._migration = migration
+        self._exc_val = None
+
     @typing.final
     def apply_to(self, session_context: session.MongoSessionContext) -> None:
         process = self.get_process(self._migration)
@@ -135,6 +238,9 @@ class AbstractMigrationTransaction(MigrationTransaction, abc.ABC):
         validation_service.validate_migration_process(process, context)
 
         mongodb_session_id = util.hexlify(session_context.mongodb_session_id)
+        # Resolved once, so the per-command log arguments are not evaluated
+        # when INFO is disabled.
+        info_enabled = _LOGGER.isEnabledFor(logging.INFO)
         try:
             waiting_commands_count = len(process.commands)
             with session_context.start_transaction():
@@ -144,15 +250,19 @@ class AbstractMigrationTransaction(MigrationTransaction, abc.ABC):
                     process.name,
                 )
 
-                for command_idx, command in enumerate(process.commands, 1):
-                    command.execute(context)
+                command_idx = 0
+                for batch in _group_bulk_commands(process.commands):
+                    _execute_batch(batch, context)
 
-                    _LOGGER.info(
-                        "%s command successfully applied (%s of %s).",
-                        command.name,
-                        command_idx,
-                        waiting_commands_count,
-                    )
+                    for command in batch.commands:
+                        command_idx += 1
+                        if info_enabled:
+                            _LOGGER.info(
+                                "%s command successfully applied (%s of %s).",
+                                command.name,
+                                command_idx,
+                                waiting_commands_count,
+                            )
 
                 self.commit(self._migration, session_context)
 
@@ -225,6 +335,8 @@ class AbstractMigrationTransaction(MigrationTransaction, abc.ABC):
 
 
 class UpgradeTransaction(AbstractMigrationTransaction):
+    __slots__: typing.Sequence[str] = ()
+
     def get_process(
         self, migration: domain_migration.Migration, /
     ) -> domain_migration.MigrationProcess:
@@ -246,6 +358,8 @@ class UpgradeTransaction(AbstractMigrationTransaction):
 
 
 class DowngradeTransaction(AbstractMigrationTransaction):
+    __slots__: typing.Sequence[str] = ()
+
     def get_process(
         self, migration: domain_migration.Migration, /
     ) -> domain_migration.MigrationProcess:
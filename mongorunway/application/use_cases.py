@@ -311,9 +311,9 @@ def check_files(
     output.print_heading(output.HEADING_LEVEL_ONE, output.TOOL_HEADING_NAME)
 
     for migration in application.session.get_all_migration_models():
-        current_migration_state = service.get_migration(migration.name, migration.version)
-        if current_migration_state.checksum != migration.checksum:
-            failed_migrations.append(current_migration_state)
+        checksum = service.get_migration_checksum(migration.name, migration.version)
+        if checksum != migration.checksum:
+            failed_migrations.append(migration)
 
     if failed_migrations:
         output.print_error(
@@ -331,16 +331,28 @@ def check_files(
 @usecase(has_verbose_exc=True)
 def refresh_checksums(application: applications.MigrationApp, verbose_exc: bool) -> ExitCode:
     service = migration_service.MigrationService(application.session)
-    modified_files = []
+    modified_migrations = []
 
     for migration in application.session.get_all_migration_models():
-        current_migration_state = service.get_migration(migration.name, migration.version)
+        # The migration is only loaded for the files that have changed.
+        checksum = service.get_migration_checksum(migration.name, migration.version)
+        if checksum != migration.checksum:
+            modified_migrations.append(
+                service.get_migration(
+                    migration.name,
+                    migration.version,
+                    is_applied=migration.is_applied,
+                )
+            )
 
-        if current_migration_state.checksum != migration.checksum:
-            application.session.remove_migration(migration.version)
-            application.session.append_migration(current_migration_state)
+    # The modified records are replaced with a batch removal and insertion.
+    if modified_migrations:
+        application.session.remove_migrations(
+            [migration.version for migration in modified_migrations]
+        )
+        application.session.append_missing_migrations(modified_migrations)
 
-            modified_files.append(current_migration_state.name)
+    modified_files = [migration.name for migration in modified_migrations]
 
     if modified_files:
         output.print_success(
@@ -365,8 +377,7 @@ def safe_remove_all_migrations(
         output.print_error("There is no migrations.")
         return FAILURE
 
-    for migration in migrations:
-        application.session.remove_migration(migration.version)
+    application.session.remove_migrations([migration.version for migration in migrations])
 
     directory = application.session.session_scripts_dir
     for file_name in os.listdir(directory):
@@ -48,10 +48,10 @@ import logging.config
 import os
 import typing
 
+from mongorunway import mongo
 from mongorunway.application.services import migration_service
 
 if typing.TYPE_CHECKING:
-    from mongorunway import mongo
     from mongorunway.application import config
     from mongorunway.application import traits
 
@@ -156,7 +156,7 @@ def configure_migration_indexes(collection: mongo.Collection) -> None:
     indexes = collection.index_information()
 
     def _create_index_if_not_exists(index: typing.Sequence[typing.Tuple[str, int]]) -> None:
-        translated_index = "_".join(f"{x}_{y}" for x, y in [_ for _ in index])
+        translated_index = mongo.translate_index(index)
 
         if translated_index not in indexes:
             _LOGGER.info(
@@ -164,6 +164,7 @@ def configure_migration_indexes(collection: mongo.Collection) -> None:
                 translated_index,
             )
             collection.create_index(index)
+            mongo.invalidate_index_cache(collection)
             _LOGGER.info("Index %s successfully configured.", translated_index)
         else:
             _LOGGER.info(
@@ -192,6 +193,7 @@ def remove_migration_indexes(collection: mongo.Collection) -> None:
                 translated_index,
             )
             collection.drop_index(index)
+            mongo.invalidate_index_cache(collection)
             _LOGGER.info("Index %s successfully dropped.", translated_index)
         else:
             _LOGGER.info(
@@ -241,19 +243,17 @@ def sync_scripts_with_repository(
 ) -> typing.Sequence[str]:
     synced = []
     service = migration_service.MigrationService(application.session)
-    for migration in service.get_migrations():
-        if not application.session.has_migration(migration):
-            application.session.append_migration(migration)
-            synced.append(migration.name)
+    for migration in application.session.append_missing_migrations(service.get_migrations()):
+        synced.append(migration.name)
 
-            _LOGGER.info(
-                "%s: migration '%s' with version %s was synced"
-                " "
-                "and successfully append to pending.",
-                sync_scripts_with_repository.__name__,
-                migration.name,
-                migration.version,
-            )
+        _LOGGER.info(
+            "%s: migration '%s' with version %s was synced"
+            " "
+            "and successfully append to pending.",
+            sync_scripts_with_repository.__name__,
+            migration.name,
+            migration.version,
+        )
 
     return synced
 
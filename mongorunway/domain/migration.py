@@ -27,6 +27,7 @@ __all__: typing.Sequence[str] = (
 )
 
 import dataclasses
+import functools
 import typing
 
 if typing.TYPE_CHECKING:
@@ -45,6 +46,7 @@ class Migration:
         "_description",
         "_upgrade_process",
         "_downgrade_process",
+        "_touches",
     )
 
     def __init__(
@@ -57,6 +59,7 @@ class Migration:
         description: str,
         upgrade_process: MigrationProcess,
         downgrade_process: MigrationProcess,
+        touches: typing.Optional[typing.AbstractSet[str]] = None,
     ) -> None:
         self._name = name
         self._version = version
@@ -65,6 +68,7 @@ class Migration:
         self._description = description
         self._upgrade_process = upgrade_process
         self._downgrade_process = downgrade_process
+        self._touches = None if touches is None else frozenset(touches)
 
     @property
     def name(self) -> str:
@@ -94,9 +98,21 @@ class Migration:
     def downgrade_process(self) -> MigrationProcess:
         return self._downgrade_process
 
+    @property
+    def touches(self) -> typing.Optional[typing.FrozenSet[str]]:
+        return self._touches
+
     def set_is_applied(self, value: bool, /) -> None:
         self._is_applied = value
 
+    def is_independent_of(self, other: Migration, /) -> bool:
+        # Migrations that did not declare the collections they touch are
+        # always considered dependent on every other migration.
+        if self._touches is None or other.touches is None:
+            return False
+
+        return self._touches.isdisjoint(other.touches)
+
     def to_dict(self, *, unique: bool = False) -> typing.Dict[str, typing.Any]:
         mapping = {
             "name": self.name,
@@ -112,30 +128,88 @@ class Migration:
         return mapping
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class MigrationReadModel:
+    # Declared by hand, `dataclass(slots=True)` requires Python 3.10.
+    __slots__: typing.ClassVar[typing.Sequence[str]] = (
+        "name",
+        "version",
+        "checksum",
+        "description",
+        "is_applied",
+    )
+
     name: str
     version: int
     checksum: str
     description: str
     is_applied: bool
 
+    # Copy and pickle support for frozen slotted instances, as generated
+    # by `dataclass(slots=True)` on newer Pythons.
+    def __getstate__(self) -> typing.List[typing.Any]:
+        return [getattr(self, field) for field in self.__slots__]
+
+    def __setstate__(self, state: typing.List[typing.Any]) -> None:
+        for field, value in zip(self.__slots__, state):
+            object.__setattr__(self, field, value)
+
     @classmethod
-    def from_dict(cls, mapping: typing.MutableMapping[str, typing.Any], /) -> MigrationReadModel:
-        mapping.pop("_id", None)  # For mongo records
-        return cls(**mapping)
+    def from_dict(cls, mapping: typing.Mapping[str, typing.Any], /) -> MigrationReadModel:
+        # Fields are read directly, so the `_id` and any other keys of mongo
+        # records are skipped without building an intermediate mapping.
+        fields = (
+            mapping["name"],
+            mapping["version"],
+            mapping["checksum"],
+            mapping["description"],
+            mapping["is_applied"],
+        )
+        if cls is not MigrationReadModel:
+            return cls(*fields)
+
+        # Records of the same migration state share one read model.
+        return _build_read_model(*fields)
 
     @classmethod
     def from_migration(cls, migration: Migration, /) -> MigrationReadModel:
-        return cls(
-            name=migration.name,
-            version=migration.version,
-            checksum=migration.checksum,
-            description=migration.description,
-            is_applied=migration.is_applied,
+        if cls is not MigrationReadModel:
+            return cls(
+                name=migration.name,
+                version=migration.version,
+                checksum=migration.checksum,
+                description=migration.description,
+                is_applied=migration.is_applied,
+            )
+
+        return _build_read_model(
+            migration.name,
+            migration.version,
+            migration.checksum,
+            migration.description,
+            migration.is_applied,
         )
 
 
+@functools.lru_cache(maxsize=1024)
+def _build_read_model(
+    name: str,
+    version: int,
+    checksum: str,
+    description: str,
+    is_applied: bool,
+) -> MigrationReadModel:
+    # Read models are frozen, so the same instance can be shared between
+    # all callers that describe the same migration state.
+    return MigrationReadModel(
+        name=name,
+        version=version,
+        checksum=checksum,
+        description=description,
+        is_applied=is_applied,
+    )
+
+
 class MigrationProcess:
     def __init__(
         self,
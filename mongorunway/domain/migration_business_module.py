@@ -31,26 +31,46 @@ from mongorunway.domain import migration as domain_migration
 class MigrationBusinessModule:
     __slots__: typing.Sequence[str] = (
         "_module",
+        "_name",
+        "_version",
+        "_location",
+        "_description",
+        "_touches",
         "_upgrade_process",
         "_downgrade_process",
     )
 
     def __init__(self, module: types.ModuleType, /) -> None:
         self._module = module
+        # Loaded modules are not modified afterwards, so their metadata is
+        # resolved once instead of on every access.
+        self._name = module.__name__.rpartition(".")[2].strip()
+        self._version: typing.Optional[int] = getattr(module, "version", None)
+        self._location = getattr(module, "__file__", None) or ""
+        self._description = module.__doc__ or ""
+        touches = getattr(module, "touches", None)
+        self._touches = None if touches is None else frozenset(touches)
         self._upgrade_process = self._get_business_process("upgrade")
         self._downgrade_process = self._get_business_process("downgrade")
 
     @property
     def location(self) -> str:
-        return self._module.__file__ or ""
+        return self._location
 
     @property
     def description(self) -> str:
-        return self._module.__doc__ or ""
+        return self._description
 
     @property
     def version(self) -> int:
-        return typing.cast(int, self._module.version)
+        if self._version is None:
+            raise AttributeError(f"Migration {self._name!r} has no 'version' variable.")
+
+        return self._version
+
+    @property
+    def touches(self) -> typing.Optional[typing.FrozenSet[str]]:
+        return self._touches
 
     @property
     def upgrade_process(self) -> domain_migration.MigrationProcess:
@@ -61,14 +81,11 @@ class MigrationBusinessModule:
         return self._downgrade_process
 
     def get_name(self) -> str:
-        *_, migration_name = self._module.__name__.split(".")
-        return migration_name.strip()
+        return self._name
 
     def _get_business_process(self, process_name: str, /) -> domain_migration.MigrationProcess:
         process = getattr(self._module, process_name, None)
         if process is None:
-            raise ValueError(
-                f"Can't find {process_name!r} process in {self.get_name()!r} migration."
-            )
+            raise ValueError(f"Can't find {process_name!r} process in {self._name!r} migration.")
 
         return process
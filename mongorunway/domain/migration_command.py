@@ -24,6 +24,7 @@ __all__: typing.Sequence[str] = (
     "MigrationCommand",
     "AnyCommandSequence",
     "AnyCommand",
+    "BulkOperations",
 )
 
 import abc
@@ -39,6 +40,8 @@ AnyCommand: typing.TypeAlias = "MigrationCommand[typing.Any]"
 
 AnyCommandSequence: typing.TypeAlias = typing.Sequence[AnyCommand]
 
+BulkOperations: typing.TypeAlias = typing.Tuple[str, typing.Sequence[typing.Any]]
+
 
 class MigrationCommand(typing.Generic[_CallbackT_co], abc.ABC):
     __slots__ = ()
@@ -47,6 +50,12 @@ class MigrationCommand(typing.Generic[_CallbackT_co], abc.ABC):
     def name(self) -> str:
         return self.__class__.__name__
 
+    def bulk_ops(self) -> typing.Optional[BulkOperations]:
+        # Write commands return their target collection name together with the
+        # equivalent pymongo bulk operations, so that consecutive commands on
+        # one collection can be sent in a single `bulk_write` round-trip.
+        return None
+
     @abc.abstractmethod
     def execute(self, ctx: domain_context.MigrationContext) -> _CallbackT_co:
         ...
@@ -35,3 +35,34 @@ class MigrationContext:
     mongodb_session_id: str = attr.field(repr=True)
     client: mongo.Client = attr.field(repr=False)
     database: mongo.Database = attr.field(repr=False)
+    _collections: typing.Dict[str, mongo.Collection] = attr.field(
+        factory=dict,
+        init=False,
+        repr=False,
+        eq=False,
+    )
+    _databases: typing.Dict[str, mongo.Database] = attr.field(
+        factory=dict,
+        init=False,
+        repr=False,
+        eq=False,
+    )
+
+    def get_database(self, name: str, /) -> mongo.Database:
+        # Same as `get_collection`, for commands that target other databases.
+        try:
+            return self._databases[name]
+        except KeyError:
+            database = self.client.get_database(name)
+            self._databases[name] = database
+            return database
+
+    def get_collection(self, name: str, /) -> mongo.Collection:
+        # Commands of one process mostly target the same few collections, so
+        # each collection object is only created once per context.
+        try:
+            return self._collections[name]
+        except KeyError:
+            collection = self.database.get_collection(name)
+            self._collections[name] = collection
+            return collection
@@ -45,19 +45,17 @@ EventHandlerT = typing.TypeVar("EventHandlerT", bound=EventHandler)
 EventHandlerProxyOr: typing.TypeAlias = typing.Union[EventHandlerT, "EventHandlerProxy"]
 
 
-@attr.define(eq=True, order=True, hash=True)
+# Equality and hashing are written by hand (and detected by attrs), so that
+# hashing a proxy does not build a tuple of its fields.
+@attr.define(order=True)
 class EventHandlerProxy:
-    _priority: int = attr.field(
-        eq=True,
-        hash=True,
-        alias="priority",
-    )  # type: ignore[call-overload]
+    _priority: int = attr.field(alias="priority")
 
     _handler: EventHandler = attr.field(
         eq=False,
         hash=False,
         alias="handler",
-    )  # type: ignore[call-overload]
+    )
 
     @property
     def priority(self) -> int:
@@ -67,6 +65,15 @@ class EventHandlerProxy:
     def handler(self) -> EventHandler:
         return self._handler
 
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return self._priority == typing.cast(EventHandlerProxy, other)._priority
+
+    def __hash__(self) -> int:
+        return hash(self._priority)
+
     def __call__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
         self._handler(*args, **kwargs)
 
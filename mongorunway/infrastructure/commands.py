@@ -111,16 +111,28 @@ def make_snake_case_global_alias(
     )
 
 
+class _SchemaCommand(domain_command.MigrationCommand[_T]):
+    # Commands that create or drop databases and collections.
+    __slots__: typing.Sequence[str] = ("args", "kwargs")
+
+
+class _CollectionSchemaCommand(_SchemaCommand[_T]):
+    __slots__: typing.Sequence[str] = ("collection",)
+
+    def __init__(self, collection: str, *args: typing.Any, **kwargs: typing.Any) -> None:
+        self.collection = collection
+        self.args = args
+        self.kwargs = kwargs
+
+
 #################################
 # ~~~ CLIENT-LEVEL COMMANDS ~~~ #
 #################################
 
 
 @make_snake_case_global_alias
-class CreateDatabase(domain_command.MigrationCommand[mongo.Database]):
+class CreateDatabase(_SchemaCommand[mongo.Database]):
     __slots__: typing.Sequence[str] = (
-        "args",
-        "kwargs",
         "collection",
         "database",
     )
@@ -138,18 +150,14 @@ class CreateDatabase(domain_command.MigrationCommand[mongo.Database]):
         self.database = database
 
     def execute(self, ctx: domain_context.MigrationContext) -> mongo.Database:
-        database = ctx.client.get_database(self.database)
+        database = ctx.get_database(self.database)
         database.create_collection(self.collection, *self.args, **self.kwargs)
         return database
 
 
 @make_snake_case_global_alias
-class DropDatabase(domain_command.MigrationCommand[None]):
-    __slots__: typing.Sequence[str] = (
-        "args",
-        "kwargs",
-        "database",
-    )
+class DropDatabase(_SchemaCommand[None]):
+    __slots__: typing.Sequence[str] = ("database",)
 
     def __init__(self, database: str, *args: typing.Any, **kwargs: typing.Any) -> None:
         self.database = database
@@ -167,17 +175,8 @@ class DropDatabase(domain_command.MigrationCommand[None]):
 
 
 @make_snake_case_global_alias
-class CreateCollection(domain_command.MigrationCommand[mongo.Collection]):
-    __slots__: typing.Sequence[str] = (
-        "args",
-        "kwargs",
-        "collection",
-    )
-
-    def __init__(self, collection: str, *args: typing.Any, **kwargs: typing.Any) -> None:
-        self.collection = collection
-        self.args = args
-        self.kwargs = kwargs
+class CreateCollection(_CollectionSchemaCommand[mongo.Collection]):
+    __slots__: typing.Sequence[str] = ()
 
     def execute(self, ctx: domain_context.MigrationContext) -> mongo.Collection:
         collection = ctx.database.create_collection(self.collection, *self.args, **self.kwargs)
@@ -185,17 +184,8 @@ class CreateCollection(domain_command.MigrationCommand[mongo.Collection]):
 
 
 @make_snake_case_global_alias
-class DropCollection(domain_command.MigrationCommand[None]):
-    __slots__: typing.Sequence[str] = (
-        "args",
-        "kwargs",
-        "collection",
-    )
-
-    def __init__(self, collection: str, *args: typing.Any, **kwargs: typing.Any) -> None:
-        self.collection = collection
-        self.args = args
-        self.kwargs = kwargs
+class DropCollection(_CollectionSchemaCommand[None]):
+    __slots__: typing.Sequence[str] = ()
 
     def execute(self, ctx: domain_context.MigrationContext) -> None:
         ctx.database.drop_collection(self.collection, *self.args, **self.kwargs)
@@ -219,6 +209,15 @@ class SendCommand(domain_command.MigrationCommand[typing.Any]):
 #####################################
 
 
+def _overrides_execute(
+    command: domain_command.AnyCommand,
+    command_type: typing.Type[domain_command.AnyCommand],
+    /,
+) -> bool:
+    # Subclasses with their own `execute` must not be replaced by bulk operations.
+    return type(command).execute is not command_type.execute
+
+
 @make_snake_case_global_alias
 class BulkWrite(domain_command.MigrationCommand[results.BulkWriteResult]):
     __slots__: typing.Sequence[str] = (
@@ -249,8 +248,20 @@ class BulkWrite(domain_command.MigrationCommand[results.BulkWriteResult]):
         self.args = args
         self.kwargs = kwargs
 
+    def bulk_ops(self) -> typing.Optional[domain_command.BulkOperations]:
+        # Empty operations are left to `bulk_write`, which rejects them.
+        if (
+            self.args
+            or self.kwargs
+            or _overrides_execute(self, BulkWrite)
+            or not self.bulk_operations
+        ):
+            return None
+
+        return self.collection, list(self.bulk_operations)
+
     def execute(self, ctx: domain_context.MigrationContext) -> results.BulkWriteResult:
-        collection = ctx.database.get_collection(self.collection)
+        collection = ctx.get_collection(self.collection)
         result = collection.bulk_write(self.bulk_operations, *self.args, **self.kwargs)
         return result
 
@@ -276,8 +287,14 @@ class InsertOne(domain_command.MigrationCommand[results.InsertOneResult]):
         self.document = document
         self.collection = collection
 
+    def bulk_ops(self) -> typing.Optional[domain_command.BulkOperations]:
+        if self.args or self.kwargs or _overrides_execute(self, InsertOne):
+            return None
+
+        return self.collection, [pymongo.InsertOne(self.document)]
+
     def execute(self, ctx: domain_context.MigrationContext) -> results.InsertOneResult:
-        collection = ctx.database.get_collection(self.collection)
+        collection = ctx.get_collection(self.collection)
         result = collection.insert_one(self.document, *self.args, **self.kwargs)
         return result
 
@@ -303,8 +320,22 @@ class InsertMany(domain_command.MigrationCommand[results.InsertManyResult]):
         self.documents = documents
         self.collection = collection
 
+    def bulk_ops(self) -> typing.Optional[domain_command.BulkOperations]:
+        # Empty documents are left to `insert_many`, which rejects them, and
+        # iterators could not be read again by `execute`.
+        if (
+            self.args
+            or self.kwargs
+            or _overrides_execute(self, InsertMany)
+            or not isinstance(self.documents, collections.abc.Sequence)
+            or not self.documents
+        ):
+            return None
+
+        return self.collection, [pymongo.InsertOne(document) for document in self.documents]
+
     def execute(self, ctx: domain_context.MigrationContext) -> results.InsertManyResult:
-        collection = ctx.database.get_collection(self.collection)
+        collection = ctx.get_collection(self.collection)
         result = collection.insert_many(self.documents, *self.args, **self.kwargs)
         return result
 
@@ -333,8 +364,14 @@ class ReplaceOne(domain_command.MigrationCommand[results.UpdateResult]):
         self.replacement = replacement
         self.collection = collection
 
+    def bulk_ops(self) -> typing.Optional[domain_command.BulkOperations]:
+        if self.args or self.kwargs or _overrides_execute(self, ReplaceOne):
+            return None
+
+        return self.collection, [pymongo.ReplaceOne(self.filter, self.replacement)]
+
     def execute(self, ctx: domain_context.MigrationContext) -> results.UpdateResult:
-        collection = ctx.database.get_collection(self.collection)
+        collection = ctx.get_collection(self.collection)
         result = collection.replace_one(self.filter, self.replacement, *self.args, **self.kwargs)
         return result
 
@@ -363,8 +400,14 @@ class UpdateOne(domain_command.MigrationCommand[results.UpdateResult]):
         self.update = update
         self.collection = collection
 
+    def bulk_ops(self) -> typing.Optional[domain_command.BulkOperations]:
+        if self.args or self.kwargs or _overrides_execute(self, UpdateOne):
+            return None
+
+        return self.collection, [pymongo.UpdateOne(self.filter, self.update)]
+
     def execute(self, ctx: domain_context.MigrationContext) -> results.UpdateResult:
-        collection = ctx.database.get_collection(self.collection)
+        collection = ctx.get_collection(self.collection)
         result = collection.update_one(self.filter, self.update, *self.args, **self.kwargs)
         return result
 
@@ -395,8 +438,14 @@ class UpdateMany(domain_command.MigrationCommand[results.UpdateResult]):
         self.update = update
         self.collection = collection
 
+    def bulk_ops(self) -> typing.Optional[domain_command.BulkOperations]:
+        if self.args or self.kwargs or _overrides_execute(self, UpdateMany):
+            return None
+
+        return self.collection, [pymongo.UpdateMany(self.filter, self.update)]
+
     def execute(self, ctx: domain_context.MigrationContext) -> results.UpdateResult:
-        collection = ctx.database.get_collection(self.collection)
+        collection = ctx.get_collection(self.collection)
         result = collection.update_many(self.filter, self.update, *self.args, **self.kwargs)
         return result
 
@@ -422,8 +471,14 @@ class DeleteOne(domain_command.MigrationCommand[results.DeleteResult]):
         self.filter = filter
         self.collection = collection
 
+    def bulk_ops(self) -> typing.Optional[domain_command.BulkOperations]:
+        if self.args or self.kwargs or _overrides_execute(self, DeleteOne):
+            return None
+
+        return self.collection, [pymongo.DeleteOne(self.filter)]
+
     def execute(self, ctx: domain_context.MigrationContext) -> results.DeleteResult:
-        collection = ctx.database.get_collection(self.collection)
+        collection = ctx.get_collection(self.collection)
         result = collection.delete_one(self.filter, *self.args, **self.kwargs)
         return result
 
@@ -449,8 +504,14 @@ class DeleteMany(domain_command.MigrationCommand[results.DeleteResult]):
         self.filter = filter
         self.collection = collection
 
+    def bulk_ops(self) -> typing.Optional[domain_command.BulkOperations]:
+        if self.args or self.kwargs or _overrides_execute(self, DeleteMany):
+            return None
+
+        return self.collection, [pymongo.DeleteMany(self.filter)]
+
     def execute(self, ctx: domain_context.MigrationContext) -> results.DeleteResult:
-        collection = ctx.database.get_collection(self.collection)
+        collection = ctx.get_collection(self.collection)
         result = collection.delete_many(self.filter, *self.args, **self.kwargs)
         return result
 
@@ -477,8 +538,9 @@ class CreateIndex(domain_command.MigrationCommand[str]):
         self.collection = collection
 
     def execute(self, ctx: domain_context.MigrationContext) -> str:
-        collection = ctx.database.get_collection(self.collection)
+        collection = ctx.get_collection(self.collection)
         result = collection.create_index(self.keys, *self.args, **self.kwargs)
+        mongo.invalidate_index_cache(collection)
         return result
 
 
@@ -504,8 +566,9 @@ class CreateIndexes(domain_command.MigrationCommand[typing.List[str]]):
         self.collection = collection
 
     def execute(self, ctx: domain_context.MigrationContext) -> typing.List[str]:
-        collection = ctx.database.get_collection(self.collection)
+        collection = ctx.get_collection(self.collection)
         result = collection.create_indexes(self.keys, *self.args, **self.kwargs)
+        mongo.invalidate_index_cache(collection)
         return result
 
 
@@ -531,8 +594,9 @@ class DropIndex(domain_command.MigrationCommand[None]):
         self.collection = collection
 
     def execute(self, ctx: domain_context.MigrationContext) -> None:
-        collection = ctx.database.get_collection(self.collection)
+        collection = ctx.get_collection(self.collection)
         collection.drop_index(self.index_or_name, *self.args, **self.kwargs)
+        mongo.invalidate_index_cache(collection)
         return None
 
 
@@ -555,8 +619,9 @@ class DropIndexes(domain_command.MigrationCommand[None]):
         self.collection = collection
 
     def execute(self, ctx: domain_context.MigrationContext) -> None:
-        collection = ctx.database.get_collection(self.collection)
+        collection = ctx.get_collection(self.collection)
         collection.drop_indexes(*self.args, **self.kwargs)
+        mongo.invalidate_index_cache(collection)
         return None
 
 
@@ -585,7 +650,7 @@ class RenameCollection(domain_command.MigrationCommand[typing.MutableMapping[str
         self,
         ctx: domain_context.MigrationContext,
     ) -> typing.MutableMapping[str, typing.Any]:
-        collection = ctx.database.get_collection(self.collection)
+        collection = ctx.get_collection(self.collection)
         result = collection.rename(self.new_name, *self.args, **self.kwargs)
         return result
 
@@ -33,15 +33,20 @@ from mongorunway.application.services import migration_service
 from mongorunway.domain import migration_event as domain_event
 from mongorunway.domain import migration_exception as domain_exception
 
+if typing.TYPE_CHECKING:
+    from mongorunway.application import session
+    from mongorunway.domain import migration as domain_migration
+
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("root.event_handlers")
 
 
 def sync_scripts_with_repository(event: domain_event.ApplicationEvent) -> None:
-    service = migration_service.MigrationService(event.application.session)
-    for migration in service.get_migrations():
-        if not event.application.session.has_migration(migration):
-            event.application.session.append_migration(migration)
+    app_session = event.application.session
+    service = migration_service.MigrationService(app_session)
+    is_logging = _LOGGER.isEnabledFor(logging.INFO)
 
+    for migration in app_session.append_missing_migrations(service.get_migrations()):
+        if is_logging:
             _LOGGER.info(
                 "%s: migration '%s' with version %s was synced"
                 " "
@@ -53,15 +58,29 @@ def sync_scripts_with_repository(event: domain_event.ApplicationEvent) -> None:
 
 
 def recalculate_migrations_checksum(event: domain_event.ApplicationEvent) -> None:
-    service = migration_service.MigrationService(event.application.session)
+    app_session = event.application.session
+    service = migration_service.MigrationService(app_session)
+    is_logging = _LOGGER.isEnabledFor(logging.INFO)
 
-    for migration in event.application.session.get_all_migration_models():
-        current_migration_state = service.get_migration(migration.name, migration.version)
+    changed_migrations = list(_iter_changed_migrations(service, app_session))
+    if not changed_migrations:
+        return
 
-        if current_migration_state.checksum != migration.checksum:
-            event.application.session.remove_migration(migration.version)
-            event.application.session.append_migration(current_migration_state)
+    # The migration is only loaded for the files that have changed, and the
+    # changed records are replaced with a batch removal and insertion.
+    current_migration_states = [
+        service.get_migration(
+            migration.name,
+            migration.version,
+            is_applied=migration.is_applied,
+        )
+        for migration, _ in changed_migrations
+    ]
+    app_session.remove_migrations([migration.version for migration, _ in changed_migrations])
+    app_session.append_missing_migrations(current_migration_states)
 
+    if is_logging:
+        for migration, checksum in changed_migrations:
             _LOGGER.info(
                 "%s: migration file '%s' with version %s is changed, checksum successfully"
                 " "
@@ -70,23 +89,31 @@ def recalculate_migrations_checksum(event: domain_event.ApplicationEvent) -> Non
                 migration.name,
                 migration.version,
                 migration.checksum,
-                current_migration_state.checksum,
+                checksum,
             )
 
 
 def raise_if_migrations_checksum_mismatch(event: domain_event.ApplicationEvent) -> None:
     service = migration_service.MigrationService(event.application.session)
 
-    for migration in event.application.session.get_all_migration_models():
-        current_migration_state = service.get_migration(migration.name, migration.version)
-        if current_migration_state.checksum != migration.checksum:
-            _LOGGER.error(
-                "%s: migration file '%s' with version %s is changed, raising...",
-                raise_if_migrations_checksum_mismatch.__name__,
-                migration.name,
-                migration.version,
-            )
-            raise domain_exception.MigrationFileChangedError(
-                migration_name=migration.name,
-                migration_version=migration.version,
-            )
+    for migration, _ in _iter_changed_migrations(service, event.application.session):
+        _LOGGER.error(
+            "%s: migration file '%s' with version %s is changed, raising...",
+            raise_if_migrations_checksum_mismatch.__name__,
+            migration.name,
+            migration.version,
+        )
+        raise domain_exception.MigrationFileChangedError(
+            migration_name=migration.name,
+            migration_version=migration.version,
+        )
+
+
+def _iter_changed_migrations(
+    service: migration_service.MigrationService,
+    app_session: session.MigrationSession,
+) -> typing.Iterator[typing.Tuple[domain_migration.MigrationReadModel, str]]:
+    for migration in app_session.get_all_migration_models():
+        checksum = service.get_migration_checksum(migration.name, migration.version)
+        if checksum != migration.checksum:
+            yield migration, checksum
@@ -26,16 +26,25 @@ __all__: typing.Sequence[str] = (
     "UnixFilenameStrategy",
 )
 
-import re
 import time
 import typing
 
 from mongorunway.application.ports import filename_strategy as filename_strategy_port
 
 
+def _collapse_underscores(filename: str, /) -> str:
+    # Most names have no empty parts, so they are returned without splitting.
+    if "__" not in filename and not filename.startswith("_") and not filename.endswith("_"):
+        return filename
+
+    return "_".join(filter(None, filename.split("_")))
+
+
 class MissingFilenameStrategy(filename_strategy_port.FilenameStrategy):
     __slots__: typing.Sequence[str] = ()
 
+    IS_NOOP: typing.ClassVar[bool] = True
+
     def is_valid_filename(self, filename: str, /) -> bool:
         return True
 
@@ -47,12 +56,14 @@ class NumericalFilenameStrategy(filename_strategy_port.FilenameStrategy):
     __slots__: typing.Sequence[str] = ()
 
     def is_valid_filename(self, filename: str, /) -> bool:
-        return all(char.isdigit() for char in filename[:3])
+        # Only ASCII digits form a position prefix, `str.isdigit` alone would
+        # also accept e.g. superscript digits.
+        prefix = filename[:3]
+        return len(prefix) == 3 and prefix.isascii() and prefix.isdigit()
 
     def transform_migration_filename(self, filename: str, position: int) -> str:
         if not self.is_valid_filename(filename):
-            filename_parts = [i for i in filename.split("_") if i]
-            return str(position).zfill(3) + "_" + "_".join(filename_parts)
+            return str(position).zfill(3) + "_" + _collapse_underscores(filename)
 
         return filename
 
@@ -61,11 +72,11 @@ class UnixFilenameStrategy(filename_strategy_port.FilenameStrategy):
     __slots__: typing.Sequence[str] = ()
 
     def is_valid_filename(self, filename: str, /) -> bool:
-        return bool(re.match(r"^\d{10,}", filename))
+        # Same as matching `^\d{10,}`, without going through the regex engine.
+        return len(filename) >= 10 and filename[:10].isdecimal()
 
     def transform_migration_filename(self, filename: str, position: int) -> str:
         if not self.is_valid_filename(filename):
-            filename_parts = [i for i in filename.split("_") if i]
-            return str(int(time.time())) + "_" + "_".join(filename_parts)
+            return str(int(time.time())) + "_" + _collapse_underscores(filename)
 
         return filename
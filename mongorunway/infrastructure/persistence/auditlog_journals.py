@@ -58,9 +58,9 @@ class MongoAuditlogJournalImpl(auditlog_journal_port.AuditlogJournal):
         self,
         entries: typing.Sequence[domain_auditlog_entry.MigrationAuditlogEntry],
     ) -> None:
-        total = self._collection.count_documents({})
-
         if self._max_records is not None:
+            # The collection is only counted when the journal is capped.
+            total = self._collection.count_documents({})
             remove = max(0, total - self._max_records + len(entries))
             if remove:
                 ids = [r["_id"] for r in self._collection.find().limit(remove)]
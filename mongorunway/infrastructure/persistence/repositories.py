@@ -23,7 +23,6 @@ from __future__ import annotations
 __all__: typing.Sequence[str] = ("MongoModelRepositoryImpl",)
 
 import enum
-import threading
 import typing
 
 import pymongo
@@ -33,6 +32,17 @@ from mongorunway.application.ports import repository as repository_port
 from mongorunway.domain import migration as domain_migration
 
 
+# Only the fields of `MigrationReadModel` are decoded from the stored records.
+_MODEL_PROJECTION: typing.Final[typing.Mapping[str, bool]] = {
+    "_id": False,
+    "name": True,
+    "version": True,
+    "checksum": True,
+    "description": True,
+    "is_applied": True,
+}
+
+
 class Index(enum.Enum):
     UNAPPLIED = [("is_applied", pymongo.ASCENDING)]
     APPLIED = [("is_applied", pymongo.ASCENDING), ("_id", pymongo.DESCENDING)]
@@ -43,50 +53,44 @@ class Index(enum.Enum):
 
 
 class MongoModelRepositoryImpl(repository_port.MigrationModelRepository):
-    __slots__: typing.Sequence[str] = (
-        "_collection",
-        "_lock",
-    )
+    __slots__: typing.Sequence[str] = ("_collection",)
 
     def __init__(self, migrations_collection: mongo.Collection) -> None:
+        # pymongo collections are thread-safe, and every method issues a single
+        # operation, so no lock is needed around them.
         self._collection = migrations_collection
-        self._lock = threading.RLock()  # Use reentrant lock to allow nested acquire/release
 
     def __len__(self) -> int:
-        with self._lock:
-            return self.has_migrations()
+        # The count is read from the collection metadata, rather than scanning
+        # the collection as `count_documents({})` does.
+        return self._collection.estimated_document_count()
 
     def __contains__(self, item: typing.Any, /) -> bool:
-        with self._lock:
-            return self.has_migration(item)
+        return self.has_migration(item)
 
     def has_migration(self, item: typing.Any, /) -> bool:
         version: typing.Optional[int] = getattr(item, "version", None)
         if version is None:
             return NotImplemented
 
-        with self._lock:
-            return self.has_migration_with_version(version)
+        return self.has_migration_with_version(version)
 
     def has_migration_with_version(self, migration_version: int, /) -> bool:
-        with self._lock:
-            return self._collection.count_documents({"_id": migration_version}) > 0
+        # An `_id` lookup is covered by the unique index, unlike `count_documents`,
+        # which runs an aggregation pipeline on the server.
+        return (
+            self._collection.find_one({"_id": migration_version}, projection={"_id": True})
+            is not None
+        )
 
     def has_migrations(self) -> bool:
-        with self._lock:
-            return bool(
-                self._collection.count_documents(
-                    {},
-                    limit=1,
-                )
-            )
+        return self._collection.find_one({}, projection={"_id": True}) is not None
 
     def acquire_migration_model_by_version(
         self,
         migration_version: int,
     ) -> typing.Optional[domain_migration.MigrationReadModel]:
-        with self._lock:
-            schema = self._collection.find_one({"_id": migration_version})
+        schema = self._collection.find_one({"_id": migration_version}, _MODEL_PROJECTION)
 
         if schema is not None:
             return domain_migration.MigrationReadModel.from_dict(schema)
@@ -96,30 +100,29 @@ class MongoModelRepositoryImpl(repository_port.MigrationModelRepository):
     def acquire_migration_model_by_flag(
         self, is_applied: bool
     ) -> typing.Optional[domain_migration.MigrationReadModel]:
-        with self._lock:
-            if is_applied:
-                # LIFO
-                schema = self._collection.find({"is_applied": True}).sort("_id", -1).limit(1)
-            else:
-                # FIFO
-                schema = self._collection.find({"is_applied": False}).sort("_id", 1).limit(1)
+        # `find_one` asks for a single batch, so the server closes the cursor
+        # right away. No hint is forced, since checking which indexes exist
+        # would cost another round-trip for a single record.
+        schema = self._collection.find_one(
+            {"is_applied": is_applied},
+            _MODEL_PROJECTION,
+            # LIFO for applied migrations, FIFO for pending ones.
+            sort=[("_id", pymongo.DESCENDING if is_applied else pymongo.ASCENDING)],
+        )
 
-        try:
-            model = domain_migration.MigrationReadModel.from_dict(schema.next())
-        except StopIteration:
-            return None
+        if schema is not None:
+            return domain_migration.MigrationReadModel.from_dict(schema)
 
-        return model
+        return None
 
     def acquire_migration_models_by_flag(
         self, *, is_applied: bool
     ) -> typing.Iterator[domain_migration.MigrationReadModel]:
         indexes = Index.APPLIED if is_applied else Index.UNAPPLIED
-        with self._lock:
-            schemas = mongo.hint_or_sort_cursor(
-                self._collection.find({"is_applied": is_applied}),
-                indexes=indexes.value,
-            )
+        schemas = mongo.hint_or_sort_cursor(
+            self._collection.find({"is_applied": is_applied}, _MODEL_PROJECTION),
+            indexes=indexes.value,
+        )
 
         while True:
             try:
@@ -134,17 +137,20 @@ class MongoModelRepositoryImpl(repository_port.MigrationModelRepository):
         *,
         ascending_id: bool = True,
     ) -> typing.Iterator[domain_migration.MigrationReadModel]:
-        with self._lock:
-            if ascending_id:
-                # By default, the collection has already created an index for the
-                # unique key `_id` which sorts them in ascending order.
-                schemas = mongo.hint_or_sort_cursor(
-                    self._collection.find({}),
-                    indexes=Index.UNIQUE.value,
-                )
-
-            else:
-                schemas = self._collection.find({}).sort([("version", pymongo.DESCENDING)])
+        if ascending_id:
+            # By default, the collection has already created an index for the
+            # unique key `_id` which sorts them in ascending order.
+            schemas = mongo.hint_or_sort_cursor(
+                self._collection.find({}, _MODEL_PROJECTION),
+                indexes=Index.UNIQUE.value,
+            )
+
+        else:
+            # The `_id` is the version, so walking the unique `_id` index
+            # backwards avoids an in-memory sort on the unindexed `version`.
+            schemas = self._collection.find({}, _MODEL_PROJECTION).sort(
+                [("_id", pymongo.DESCENDING)]
+            )
 
         while True:
             try:
@@ -157,26 +163,54 @@ class MongoModelRepositoryImpl(repository_port.MigrationModelRepository):
     def append_migration(self, migration: domain_migration.Migration, /) -> int:
         schema = migration.to_dict(unique=True)
 
-        with self._lock:
-            self._collection.insert_one(
-                schema,
-                bypass_document_validation=True,
-            )
+        self._collection.insert_one(
+            schema,
+            bypass_document_validation=True,
+        )
 
         return migration.version
 
+    def append_migrations(
+        self,
+        migrations: typing.Sequence[domain_migration.Migration],
+        /,
+    ) -> typing.Sequence[int]:
+        if not migrations:
+            return []
+
+        self._collection.insert_many(
+            [migration.to_dict(unique=True) for migration in migrations],
+            bypass_document_validation=True,
+        )
+
+        return [migration.version for migration in migrations]
+
+    def acquire_migration_versions(self) -> typing.FrozenSet[int]:
+        return frozenset(self._collection.distinct("_id"))
+
     def remove_migration(self, migration_version: int, /) -> int:
-        with self._lock:
-            self._collection.delete_one({"_id": migration_version})
+        self._collection.delete_one({"_id": migration_version})
 
         return migration_version
 
+    def remove_migrations(
+        self,
+        migration_versions: typing.Sequence[int],
+        /,
+    ) -> typing.Sequence[int]:
+        if not migration_versions:
+            return []
+
+        # A single round-trip instead of one `delete_one` per migration.
+        self._collection.delete_many({"_id": {"$in": list(migration_versions)}})
+
+        return list(migration_versions)
+
     def set_applied_flag(self, migration: domain_migration.Migration, is_applied: bool) -> int:
-        with self._lock:
-            self._collection.update_one(
-                {"_id": migration.version},
-                {"$set": {"is_applied": is_applied}},
-                bypass_document_validation=True,
-            )
+        self._collection.update_one(
+            {"_id": migration.version},
+            {"$set": {"is_applied": is_applied}},
+            bypass_document_validation=True,
+        )
 
         return migration.version
@@ -28,10 +28,13 @@ __all__: typing.Sequence[str] = (
     "ClientSession",
     "Cursor",
     "hint_or_sort_cursor",
+    "invalidate_index_cache",
     "translate_index",
 )
 
+import threading
 import typing
+import weakref
 
 import pymongo
 from pymongo import client_session
@@ -58,28 +61,52 @@ def translate_index(
     if isinstance(indexes, tuple) and isinstance(indexes[0], str):
         return f"{indexes[0]}_{indexes[1]}"
 
-    translated_index = "_".join(f"{x}_{y}" for x, y in indexes)
+    # `str.join` materialises a generator into a list first anyway, so a list
+    # comprehension skips the generator frame.
+    translated_index = "_".join([f"{x}_{y}" for x, y in indexes])
     return translated_index
 
 
+# Listing indexes is a round-trip, while the indexes of a collection rarely
+# change, so their names are kept per collection until invalidated.
+_index_names: weakref.WeakKeyDictionary[
+    Collection, typing.FrozenSet[typing.Any]
+] = weakref.WeakKeyDictionary()
+# Weak dictionaries are not thread-safe, while migrations may be applied
+# from several threads at once.
+_index_names_lock = threading.Lock()
+
+
+def _get_index_names(collection: Collection, /) -> typing.FrozenSet[typing.Any]:
+    with _index_names_lock:
+        index_names = _index_names.get(collection)
+
+    if index_names is None:
+        index_names = frozenset(collection.index_information())
+        with _index_names_lock:
+            _index_names[collection] = index_names
+
+    return index_names
+
+
+def invalidate_index_cache(collection: Collection, /) -> None:
+    with _index_names_lock:
+        _index_names.pop(collection, None)
+
+
 def hint_or_sort_cursor(
     cursor: Cursor,
     /,
     indexes: typing.Union[str, typing.Sequence[typing.Tuple[str, int]]],
 ) -> Cursor:
-    index_info = cursor.collection.index_information()
+    index_names = _get_index_names(cursor.collection)
     if isinstance(indexes, str):
-        if indexes not in index_info:
-            return cursor.sort(indexes)
+        required_names: typing.Sequence[str] = (indexes,)
     else:
-        for index in indexes:
-            if isinstance(index, tuple):
-                index_name, _ = index
-                if index_name not in index_info:
-                    return cursor.sort(indexes)
-
-            if isinstance(index, str):
-                if index not in index_info:
-                    return cursor.sort(indexes)
+        required_names = [index if isinstance(index, str) else index[0] for index in indexes]
+
+    # Stops at the first missing index, like the hint would fail there.
+    if not all(name in index_names for name in required_names):
+        return cursor.sort(indexes)
 
     return cursor.hint(indexes)
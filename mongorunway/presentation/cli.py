@@ -39,7 +39,9 @@ __all__: typing.Sequence[str] = (
 )
 
 import functools
+import os
 import sys
+import threading
 import typing
 
 import click
@@ -48,20 +50,82 @@ from mongorunway.application import applications
 from mongorunway.application import use_cases
 from mongorunway.presentation import presenters
 
+if typing.TYPE_CHECKING:
+    from mongorunway.application import config
+
 _P = typing.ParamSpec("_P")
 _T = typing.TypeVar("_T")
 _CommandT = typing.TypeVar("_CommandT")
 
 
+# Reading a configuration parses the file and opens new mongo clients, so
+# commands that run in the same process reuse it until the file changes.
+_configurations: typing.Dict[
+    typing.Tuple[str, typing.Optional[str], str],
+    typing.Tuple[typing.Tuple[int, int], config.Config],
+] = {}
+_configurations_lock = threading.Lock()
+
+
+def _get_file_state(filepath: str, /) -> typing.Optional[typing.Tuple[int, int]]:
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+
+    # The size catches rewrites that land within the filesystem's mtime granularity.
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_configuration(
+    config_file: typing.Optional[str],
+    application_name: str,
+    verbose_exc: bool,
+    use_cache: bool = True,
+) -> use_cases.UseCaseFailedOr[config.Config]:
+    # Without an explicit file, the configuration is searched relative to
+    # the working directory.
+    key = (os.getcwd(), config_file, application_name)
+    if use_cache:
+        with _configurations_lock:
+            cached = _configurations.get(key)
+
+        if cached is not None:
+            file_state, configuration = cached
+            if _get_file_state(configuration.filesystem.config_dir) == file_state:
+                return configuration
+
+    configuration = use_cases.read_configuration(
+        config_file,
+        app_name=application_name,
+        verbose_exc=verbose_exc,
+    )
+
+    if configuration is not use_cases.UseCaseFailed and (
+        (read_state := _get_file_state(configuration.filesystem.config_dir)) is not None
+    ):
+        with _configurations_lock:
+            _configurations[key] = (read_state, configuration)
+
+    return configuration
+
+
 def pass_application(command: typing.Callable[_P, _T]) -> typing.Callable[_P, _T]:
     click.option("--config-file", type=click.STRING)(command)
+    click.option(
+        "--no-app-cache",
+        is_flag=True,
+        help="Read the configuration again instead of reusing one read by a previous command.",
+    )(command)
 
     @click.pass_context
     def wrapper(ctx: click.Context, *args: _P.args, **kwargs: _P.kwargs) -> _T:
-        configuration = use_cases.read_configuration(
-            ctx.params["config_file"],
-            app_name=ctx.params["application_name"],
-            verbose_exc=ctx.params.get("verbose_exc", False),
+        params = ctx.params
+        configuration = _read_configuration(
+            params["config_file"],
+            params["application_name"],
+            params.get("verbose_exc", False),
+            use_cache=not params["no_app_cache"],
         )
 
         if configuration is use_cases.UseCaseFailed:
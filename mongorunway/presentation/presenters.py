@@ -66,16 +66,25 @@ def show_auditlog_entries(
         )
 
 
+def _get_version_summary(
+    application: applications.MigrationApp,
+) -> typing.Tuple[typing.Optional[int], int]:
+    # The current version is looked up by the session, which keeps it between
+    # changes, so only the total is read from the stored models.
+    return (
+        application.session.get_current_version(),
+        len(application.session.get_all_migration_models()),
+    )
+
+
 def show_version(application: applications.MigrationApp) -> None:
-    version_result = application.session.get_current_version()
+    current_version, all_migrations_len = _get_version_summary(application)
 
-    if version_result is not use_cases.UseCaseFailed:
-        presentation = f"Current applied version is {version_result}"
-        all_applied_migrations_len = len(list(application.session.get_all_migration_models()))
-        presentation += f" " + f"({version_result} of {all_applied_migrations_len})"
+    presentation = f"Current applied version is {current_version}"
+    presentation += f" " + f"({current_version} of {all_migrations_len})"
 
-        output.print_heading(output.HEADING_LEVEL_ONE, output.TOOL_HEADING_NAME)
-        output.print_success(presentation)
+    output.print_heading(output.HEADING_LEVEL_ONE, output.TOOL_HEADING_NAME)
+    output.print_success(presentation)
 
 
 def show_status(
@@ -96,11 +105,8 @@ def show_status(
         else:
             presentation = f"Applying failed in depth {pushed_depth!r}"
 
-        presentation += f" " + (
-            f"({application.session.get_current_version()}"
-            f" "
-            f"of {len(list(application.session.get_all_migration_models()))})"
-        )
+        current_version, all_migrations_len = _get_version_summary(application)
+        presentation += f" " + f"({current_version} of {all_migrations_len})"
 
         output.print_heading(output.HEADING_LEVEL_ONE, output.TOOL_HEADING_NAME)
         output.print_info(presentation)
@@ -37,12 +37,14 @@ __all__: typing.Sequence[str] = (
     "build_mapping_values",
     "build_optional_kwargs",
     "is_valid_filename",
+    "is_valid_file_entry",
     "hexlify",
 )
 
 import binascii
 import copy
 import distutils.util
+import functools
 import importlib
 import importlib.util
 import os
@@ -63,6 +65,8 @@ except AttributeError:
 _T = typing.TypeVar("_T")
 _TT = typing.TypeVar("_TT", bound=typing.Type[typing.Any])
 
+_module_cache: typing.Dict[str, typing.Tuple[typing.Tuple[int, int], types.ModuleType]] = {}
+
 string_case_pattern: typing.Final[typing.Pattern[str]] = re.compile(
     r"""
     (?<=_)     # Positive lookbehind assertion for an underscore character
@@ -277,6 +281,8 @@ def get_module(directory: str, filename: str) -> types.ModuleType:
 
     Load and return a module based on the given directory and filename.
     Also supports the format without a file extension e.g. '.py' .
+    Loaded modules are cached and only executed again once the size or
+    the modification time of the file changes.
 
     Parameters
     ----------
@@ -313,13 +319,27 @@ def get_module(directory: str, filename: str) -> types.ModuleType:
     --------
     importlib.spec_from_file_location
     """
-    sys.path.append(os.getcwd())
-    if not filename.endswith(".py"):
+    # `str.rstrip` would strip a set of characters, e.g. "copy.py" -> "co".
+    if filename.endswith(".py"):
+        module_name = filename[:-3]
+    else:
+        module_name = filename
         filename += ".py"
 
-    spec = importlib.util.spec_from_file_location(
-        filename.rstrip(".py"), (path := os.path.join(directory, filename))
-    )
+    path = os.path.join(directory, filename)
+    try:
+        stat_result = os.stat(path)
+    except FileNotFoundError:
+        raise ModuleNotFoundError(f"Module {path!r} is not found.")
+
+    # Same invalidation rule that the import system uses for bytecode caches.
+    cache_key = os.path.abspath(path)
+    file_state = (stat_result.st_mtime_ns, stat_result.st_size)
+    if (cached := _module_cache.get(cache_key)) is not None and cached[0] == file_state:
+        return cached[1]
+
+    sys.path.append(os.getcwd())
+    spec = importlib.util.spec_from_file_location(module_name, path)
     if spec is None:
         raise ModuleNotFoundError(f"Module {path!r} is not found.")
 
@@ -328,6 +348,7 @@ def get_module(directory: str, filename: str) -> types.ModuleType:
     spec.loader.exec_module(module)
 
     sys.path.remove(os.getcwd())
+    _module_cache[cache_key] = (file_state, module)
     return module
 
 
@@ -355,9 +376,16 @@ def import_obj(obj_path: str, /, cast: _TT) -> _TT:
     --------
     importlib.import_module
     """
+    return typing.cast(cast, _import_obj(obj_path))
+
+
+@functools.lru_cache(maxsize=None)
+def _import_obj(obj_path: str, /) -> typing.Any:
+    # Config readers resolve the same few paths, e.g. once per configured
+    # event handler. Failed lookups raise and are therefore not cached.
     module_name, obj_name = obj_path.rsplit(".", maxsplit=1)
     module = importlib.import_module(module_name)
-    return typing.cast(cast, getattr(module, obj_name))
+    return getattr(module, obj_name)
 
 
 def is_valid_filename(directory: str, filename: str) -> bool:
@@ -400,13 +428,38 @@ def is_valid_filename(directory: str, filename: str) -> bool:
     if not os.path.isdir(directory):
         raise ValueError(f"The specified path {directory!r} is not a directory.")
 
+    # The name checks come first, so that rejected names skip the stat call.
     return (
-        os.path.isfile(os.path.join(directory, filename))
-        and filename.endswith(".py")
+        filename.endswith(".py")
         and not filename.startswith("__")
+        and os.path.isfile(os.path.join(directory, filename))
     )
 
 
+def is_valid_file_entry(entry: os.DirEntry[str], /) -> bool:
+    r"""Validates the directory entry.
+
+    Same check as `is_valid_filename`, but for an entry produced by
+    `os.scandir`, whose file type is cached, so no extra stat call is
+    needed.
+
+    Parameters
+    ----------
+    entry : os.DirEntry[str]
+        The directory entry to be checked.
+
+    Returns
+    -------
+    bool
+        True if the entry is a valid migration file, False otherwise.
+
+    See Also
+    --------
+    is_valid_filename : Relationship.
+    """
+    return entry.name.endswith(".py") and not entry.name.startswith("__") and entry.is_file()
+
+
 def as_snake_case(obj: typing.Any) -> str:
     r"""Converts an object to snake case format.
 
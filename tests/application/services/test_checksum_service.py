@@ -39,4 +39,4 @@ def test_calculate_template_migration_checksum(tmp_path: pathlib.Path) -> None:
         )
 
     module = domain_module.MigrationBusinessModule(util.get_module(str(tmp_path), filename))
-    assert calculate_migration_checksum(module) == "fab6ec5a26e7455d67e299f0d6ea25fc"
+    assert calculate_migration_checksum(module) == "91e1508fab1526496b7a4b082e221339"
@@ -20,10 +20,16 @@
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
+import os
+
+import attr
 import pytest
 
 from mongorunway.application import applications
+from mongorunway.application import config
+from mongorunway.application.services import checksum_service
 from mongorunway.application.services.migration_service import MigrationService
+from mongorunway.application.services.migration_service import migration_file_template
 from mongorunway.domain import migration as domain_migration
 
 
@@ -67,6 +73,64 @@ class TestMigrationService:
         migration_from_file = service.get_migration(migration.name, migration.version)
         assert isinstance(migration_from_file, domain_migration.Migration)
 
+    def test_get_migration_with_known_flag(
+        self,
+        application: applications.MigrationApp,
+        migration: domain_migration.Migration,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        service = MigrationService(application.session)
+        service.create_migration_file_template(migration.name, migration.version)
+
+        monkeypatch.setattr(application.session, "get_migration_model_by_version", pytest.fail)
+        migration_from_file = service.get_migration(
+            migration.name,
+            migration.version,
+            is_applied=True,
+        )
+        assert migration_from_file.is_applied
+
+    def test_get_migration_reuses_business_processes(
+        self,
+        application: applications.MigrationApp,
+        migration: domain_migration.Migration,
+    ) -> None:
+        service = MigrationService(application.session)
+        service.create_migration_file_template(migration.name, migration.version)
+
+        first = service.get_migration(migration.name, migration.version)
+        second = service.get_migration(migration.name, migration.version)
+        assert first is not second
+        assert first.upgrade_process is second.upgrade_process
+        assert first.downgrade_process is second.downgrade_process
+
+    def test_get_migration_reuses_checksum(
+        self,
+        application: applications.MigrationApp,
+        migration: domain_migration.Migration,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        service = MigrationService(application.session)
+        service.create_migration_file_template(migration.name, migration.version)
+        checksum = service.get_migration(migration.name, migration.version).checksum
+
+        monkeypatch.setattr(checksum_service, "calculate_migration_checksum", pytest.fail)
+        assert service.get_migration(migration.name, migration.version).checksum == checksum
+
+    def test_get_migration_checksum(
+        self,
+        application: applications.MigrationApp,
+        migration: domain_migration.Migration,
+    ) -> None:
+        service = MigrationService(application.session)
+        service.create_migration_file_template(migration.name, migration.version)
+
+        checksum = service.get_migration_checksum(migration.name, migration.version)
+        assert checksum == service.get_migration(migration.name, migration.version).checksum
+
+        with pytest.raises(ModuleNotFoundError):
+            service.get_migration_checksum("missing", 2)
+
     def test_get_migrations_from_directory(
         self,
         application: applications.MigrationApp,
@@ -80,3 +144,133 @@ class TestMigrationService:
         service.create_migration_file_template(migration2.name, migration2.version)
 
         assert len(service.get_migrations()) == 2
+
+    def test_get_migrations_builds_new_migrations(
+        self,
+        application: applications.MigrationApp,
+        migration: domain_migration.Migration,
+    ) -> None:
+        service = MigrationService(application.session)
+        service.create_migration_file_template(migration.name, migration.version)
+
+        (first,) = service.get_migrations()
+        assert not first.is_applied
+
+        application.session.append_migration(first)
+        application.session.set_applied_flag(first, True)
+
+        # Migrations are mutable, so every call builds its own with the
+        # current applied flags.
+        (applied,) = service.get_migrations()
+        assert applied is not first
+        assert applied.upgrade_process is first.upgrade_process
+        assert applied.is_applied
+        assert not first.is_applied
+
+    def test_create_migration_file_template_does_not_load_migrations(
+        self,
+        application: applications.MigrationApp,
+        migration: domain_migration.Migration,
+        migration2: domain_migration.Migration,
+    ) -> None:
+        service = MigrationService(application.session)
+        service.create_migration_file_template(migration.name)
+
+        scripts_dir = application.session.session_scripts_dir
+        (filename,) = os.listdir(scripts_dir)
+        with open(os.path.join(scripts_dir, filename), "a") as file:
+            file.write("raise RuntimeError\n")
+
+        # The broken script is only counted, never imported.
+        service.create_migration_file_template(migration2.name)
+        assert len(os.listdir(scripts_dir)) == 2
+
+    def test_get_migrations_reads_applied_flags_once(
+        self,
+        application: applications.MigrationApp,
+        migration: domain_migration.Migration,
+        migration2: domain_migration.Migration,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        service = MigrationService(application.session)
+        service.create_migration_file_template(migration.name, migration.version)
+        service.create_migration_file_template(migration2.name, migration2.version)
+
+        applied = service.get_migration(migration.name, migration.version)
+        application.session.append_migration(applied)
+        application.session.set_applied_flag(applied, True)
+
+        monkeypatch.setattr(application.session, "get_migration_model_by_version", pytest.fail)
+        assert [m.is_applied for m in service.get_migrations()] == [True, False]
+
+    def test_get_migrations_takes_version_from_module(
+        self,
+        application: applications.MigrationApp,
+        migration: domain_migration.Migration,
+    ) -> None:
+        service = MigrationService(application.session)
+        service.create_migration_file_template(migration.name, migration.version)
+
+        (filename,) = os.listdir(application.session.session_scripts_dir)
+        path = os.path.join(application.session.session_scripts_dir, filename)
+        with open(path) as file:
+            content = file.read()
+
+        with open(path, "w") as file:
+            file.write(content.replace("version = 1", "version = 10"))
+
+        (migration_from_file,) = service.get_migrations()
+        assert migration_from_file.version == 10
+
+    def test_get_migrations_non_strict(self, configuration: config.Config) -> None:
+        configuration = attr.evolve(
+            configuration,
+            filesystem=attr.evolve(configuration.filesystem, use_filename_strategy=False),
+        )
+        service = MigrationService(applications.MigrationAppImpl(configuration).session)
+
+        with pytest.raises(ValueError):
+            service.get_migrations()
+
+        # Versions are taken from the modules, not from the file order.
+        service.create_migration_file_template("c.py", 1)
+        service.create_migration_file_template("a.py", 2)
+        service.create_migration_file_template("b.py", 3)
+        assert [m.name for m in service.get_migrations()] == ["c", "a", "b"]
+
+        with open(os.path.join(configuration.filesystem.scripts_dir, "d.py"), "w") as f:
+            f.write("")
+
+        with pytest.raises(ImportError, match="must have 'version' variable"):
+            service.get_migrations()
+
+    def test_create_migration_file_template_content(
+        self,
+        application: applications.MigrationApp,
+        migration: domain_migration.Migration,
+    ) -> None:
+        service = MigrationService(application.session)
+        service.create_migration_file_template(migration.name, migration.version)
+
+        (filename,) = os.listdir(application.session.session_scripts_dir)
+        with open(os.path.join(application.session.session_scripts_dir, filename)) as file:
+            assert file.read() == migration_file_template.safe_substitute(
+                version=migration.version,
+                upgrade_commands=[],
+                downgrade_commands=[],
+            )
+
+    def test_create_migration_file_template_counts_current_files(
+        self,
+        application: applications.MigrationApp,
+    ) -> None:
+        service = MigrationService(application.session)
+        service.create_migration_file_template("first")
+        service.create_migration_file_template("second")
+
+        scripts_dir = application.session.session_scripts_dir
+        os.remove(os.path.join(scripts_dir, max(os.listdir(scripts_dir))))
+
+        # The removed script is not counted, so its version is reused.
+        service.create_migration_file_template("third")
+        assert service.get_migrations()[-1].version == 2
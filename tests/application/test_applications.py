@@ -20,14 +20,87 @@
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
+import asyncio
+import logging
+import threading
+import typing
+
+import attr
 import pytest
 
 from mongorunway.application import applications
+from mongorunway.application import config
+from mongorunway.application import traits
+from mongorunway.application import transactions
 from mongorunway.domain import migration as domain_migration
+from mongorunway.domain import migration_event as domain_event
 from mongorunway.domain import migration_exception as domain_exception
 from tests import tools
 
 
+def test_application_logger_adapter(caplog: pytest.LogCaptureFixture) -> None:
+    logger = applications._ApplicationLoggerAdapter(logging.getLogger("mongorunway.ui"), "myapp")
+
+    with caplog.at_level(logging.INFO, logger="mongorunway.ui"):
+        logger.info("upgraded to (#%s).", 1)
+
+    (record,) = caplog.records
+    assert record.getMessage() == "myapp: upgraded to (#1)."
+    assert record.app == "myapp"
+
+
+def test_starting_event_is_dispatched_lazily(configuration: config.Config) -> None:
+    events = []
+    configuration = attr.evolve(
+        configuration,
+        application=attr.evolve(
+            configuration.application,
+            app_events={domain_event.StartingEvent: [events.append]},
+        ),
+    )
+
+    application = applications.MigrationAppImpl(configuration)
+    assert application.name == configuration.application.app_name
+    assert not events
+
+    application.session
+    application.session
+    assert len(events) == 1
+
+
+def test_batch_independent_migrations(
+    migration: domain_migration.Migration,
+    migration2: domain_migration.Migration,
+    make_migration: typing.Callable[..., domain_migration.Migration],
+) -> None:
+    # Migrations without declared collections are never batched together.
+    assert applications._batch_independent_migrations([migration, migration2]) == [
+        [migration],
+        [migration2],
+    ]
+
+    users, orders = make_migration(1, {"users"}), make_migration(2, {"orders"})
+    assert applications._batch_independent_migrations([users, orders]) == [[users, orders]]
+
+    users2 = make_migration(2, {"users"})
+    assert applications._batch_independent_migrations([users, users2]) == [[users], [users2]]
+
+
+def test_current_version_sees_other_applications(
+    application: applications.MigrationApp,
+    configuration: config.Config,
+    migration: domain_migration.Migration,
+) -> None:
+    assert application.session.get_current_version() is None
+
+    # Another application writing to the same collection.
+    other = applications.MigrationAppImpl(configuration)
+    other.session.append_migration(migration)
+    other.session.set_applied_flag(migration, True)
+
+    assert application.session.get_current_version() == migration.version
+
+
 class TestMigrationApp:
     def test_downgrade_once(
         self,
@@ -58,6 +131,25 @@ class TestMigrationApp:
         with pytest.raises(domain_exception.NothingToUpgradeError):
             application.upgrade_once()
 
+    def test_nothing_to_do_without_raising(self, configuration: config.Config) -> None:
+        application = applications.MigrationAppImpl(
+            attr.evolve(
+                configuration,
+                application=attr.evolve(
+                    configuration.application,
+                    raise_on_transaction_failure=False,
+                ),
+            )
+        )
+
+        for method in (
+            application.upgrade_once,
+            application.downgrade_once,
+            application.upgrade_all,
+            application.downgrade_all,
+        ):
+            assert method() == transactions.TRANSACTION_NOT_APPLIED
+
     def test_downgrade_to(
         self,
         application: applications.MigrationApp,
@@ -78,6 +170,9 @@ class TestMigrationApp:
         application.downgrade_to(1)
         assert application.session.get_current_version() == 1
 
+        with pytest.raises(ValueError, match="already pending"):
+            application.downgrade_to(2)
+
     def test_upgrade_to(
         self,
         application: applications.MigrationApp,
@@ -96,6 +191,9 @@ class TestMigrationApp:
         application.upgrade_to(2)
         assert application.session.get_current_version() == 2
 
+        with pytest.raises(ValueError, match="already applied"):
+            application.upgrade_to(1)
+
     def test_downgrade_all(
         self,
         application: applications.MigrationApp,
@@ -160,3 +258,70 @@ class TestMigrationApp:
 
         application.upgrade_while(lambda m: m.version <= 2)
         assert application.session.get_current_version() == 2
+
+    def test_upgrade_while_logs_summary(
+        self,
+        application: applications.MigrationApp,
+        migration: domain_migration.Migration,
+        migration2: domain_migration.Migration,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        tools.prepare_two_migrations(application, migration, migration2)
+
+        with caplog.at_level(logging.INFO, logger="mongorunway.ui"):
+            assert application.upgrade_all() == 2
+            assert application.downgrade_all() == 2
+
+        assert [r.getMessage() for r in caplog.records if r.name == "mongorunway.ui"] == [
+            "test: Successfully upgraded 2 migration(s) (#None -> #2).",
+            "test: successfully downgraded 2 migration(s) (#2 -> #None).",
+        ]
+
+    def test_upgrade_all_async(
+        self,
+        application: applications.MigrationApp,
+        migration: domain_migration.Migration,
+        migration2: domain_migration.Migration,
+    ) -> None:
+        tools.prepare_two_migrations(application, migration, migration2)
+        assert application.session.get_current_version() is None
+
+        assert asyncio.run(application.upgrade_all_async()) == 2
+        assert application.session.get_current_version() == 2
+
+        with pytest.raises(domain_exception.NothingToUpgradeError):
+            asyncio.run(application.upgrade_all_async())
+
+    def test_upgrade_all_async_prepares_in_executor(
+        self,
+        application: applications.MigrationApp,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        get_models = application.session.get_migration_models_by_flag
+        threads = []
+
+        def get_migration_models_by_flag(
+            *, is_applied: bool
+        ) -> typing.MutableSequence[domain_migration.MigrationReadModel]:
+            threads.append(threading.current_thread())
+            return get_models(is_applied=is_applied)
+
+        monkeypatch.setattr(
+            application.session, "get_migration_models_by_flag", get_migration_models_by_flag
+        )
+        with pytest.raises(domain_exception.NothingToUpgradeError):
+            asyncio.run(application.upgrade_all_async())
+
+        assert threads and threading.main_thread() not in threads
+
+    def test_default_upgrade_all_async(
+        self,
+        application: applications.MigrationApp,
+        migration: domain_migration.Migration,
+        migration2: domain_migration.Migration,
+    ) -> None:
+        assert "upgrade_all_async" not in traits.MigrationRunner.__abstractmethods__
+
+        tools.prepare_two_migrations(application, migration, migration2)
+        assert asyncio.run(traits.MigrationRunner.upgrade_all_async(application)) == 2
+        assert application.session.get_current_version() == 2
@@ -0,0 +1,130 @@
+# Copyright (c) 2023 Animatea
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from __future__ import annotations
+
+import functools
+import gc
+import typing
+import weakref
+
+import pytest
+
+from mongorunway.application import event_manager
+from mongorunway.domain import migration_event as domain_event
+
+
+def _make_handler(
+    calls: typing.List[str], name: str
+) -> typing.Callable[[domain_event.MigrationEvent], None]:
+    def handler(event: domain_event.MigrationEvent) -> None:
+        calls.append(name)
+
+    return handler
+
+
+class TestMigrationEventManagerImpl:
+    def test_dispatch_order(self) -> None:
+        calls: typing.List[str] = []
+        manager = event_manager.MigrationEventManagerImpl()
+
+        manager.subscribe_event_handler(_make_handler(calls, "plain"), domain_event.MigrationEvent)
+        for priority, name in ((2, "second"), (1, "first"), (2, "second_tie"), (3, "third")):
+            manager.subscribe_event_handler(
+                domain_event.EventHandlerProxy(
+                    priority=priority,
+                    handler=_make_handler(calls, name),
+                ),
+                domain_event.MigrationEvent,
+            )
+
+        manager.dispatch(domain_event.MigrationEvent())
+        assert calls == ["first", "second", "second_tie", "third", "plain"]
+
+    def test_dispatch_same_priority(self) -> None:
+        calls: typing.List[str] = []
+        manager = event_manager.MigrationEventManagerImpl()
+
+        for name in ("first", "second", "third"):
+            manager.subscribe_event_handler(
+                domain_event.EventHandlerProxy(priority=1, handler=_make_handler(calls, name)),
+                domain_event.MigrationEvent,
+            )
+
+        manager.dispatch(domain_event.MigrationEvent())
+        assert calls == ["first", "second", "third"]
+
+    def test_dispatch_without_handlers(self) -> None:
+        manager = event_manager.MigrationEventManagerImpl()
+
+        manager.dispatch(domain_event.MigrationEvent())
+        assert domain_event.MigrationEvent not in manager._event_dict
+
+    def test_listen_uses_event_annotation(self) -> None:
+        manager = event_manager.MigrationEventManagerImpl()
+
+        def handler(event: typing.Union[domain_event.StartingEvent, domain_event.ClosingEvent]):
+            ...
+
+        manager.listen()(handler)
+        assert manager.get_event_handlers_for(domain_event.StartingEvent) == [handler]
+        assert manager.get_event_handlers_for(domain_event.ClosingEvent) == [handler]
+
+        other_manager = event_manager.MigrationEventManagerImpl()
+        other_manager.listen()(handler)
+        assert other_manager.get_event_handlers_for(domain_event.StartingEvent) == [handler]
+
+    def test_listen_does_not_keep_method_handlers_alive(self) -> None:
+        class Listener:
+            def handle(self, event: domain_event.StartingEvent) -> None:
+                ...
+
+        listener = Listener()
+        listener_ref = weakref.ref(listener)
+
+        manager = event_manager.MigrationEventManagerImpl()
+        manager.listen()(listener.handle)
+        assert manager.get_event_handlers_for(domain_event.StartingEvent) == [listener.handle]
+
+        del listener, manager
+        gc.collect()
+        assert listener_ref() is None
+
+    def test_listen_without_event_annotation(self) -> None:
+        manager = event_manager.MigrationEventManagerImpl()
+
+        def handler(event):  # type: ignore[no-untyped-def]
+            ...
+
+        with pytest.raises(ValueError, match="Handler missing 'event' parameter"):
+            manager.listen()(handler)
+
+    def test_listen_wrapped_handler(self) -> None:
+        manager = event_manager.MigrationEventManagerImpl()
+
+        def handler(event: domain_event.StartingEvent) -> None:
+            ...
+
+        @functools.wraps(handler)
+        def wrapper(*args: typing.Any, **kwargs: typing.Any) -> None:
+            ...
+
+        manager.listen()(wrapper)
+        assert manager.get_event_handlers_for(domain_event.StartingEvent) == [wrapper]
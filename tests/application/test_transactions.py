@@ -0,0 +1,191 @@
+# Copyright (c) 2023 Animatea
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from __future__ import annotations
+
+import typing
+
+import pytest
+from pymongo import errors
+
+from mongorunway.application import applications
+from mongorunway.application import transactions
+from mongorunway.domain import migration as domain_migration
+from mongorunway.domain import migration_context as domain_context
+from mongorunway.infrastructure import commands
+
+
+class TestMigrationTransaction:
+    def test_slots(
+        self,
+        application: applications.MigrationApp,
+        migration: domain_migration.Migration,
+    ) -> None:
+        transaction = transactions.UpgradeTransaction.create(application.session, migration)
+        assert not hasattr(transaction, "__dict__")
+
+    def test_reset(
+        self,
+        application: applications.MigrationApp,
+        migration: domain_migration.Migration,
+        migration2: domain_migration.Migration,
+    ) -> None:
+        transaction = transactions.UpgradeTransaction.create(application.session, migration)
+        transaction._exc_val = ValueError()
+        assert transaction.is_failed()
+
+        transaction.reset(migration2)
+        assert not transaction.is_failed()
+        assert transaction.exc_val is None
+
+    def test_begin_transaction_reuses_instance(
+        self,
+        application: applications.MigrationApp,
+        migration: domain_migration.Migration,
+        migration2: domain_migration.Migration,
+    ) -> None:
+        with application.session.begin_transaction(
+            transactions.DowngradeTransaction,
+            migration=migration,
+        ) as transaction:
+            assert isinstance(transaction, transactions.DowngradeTransaction)
+
+        with application.session.begin_transaction(
+            transaction,
+            migration=migration2,
+        ) as reused_transaction:
+            assert reused_transaction is transaction
+
+    def test_begin_transaction_without_reset(
+        self,
+        application: applications.MigrationApp,
+        migration: domain_migration.Migration,
+        migration2: domain_migration.Migration,
+    ) -> None:
+        assert "reset" not in transactions.MigrationTransaction.__abstractmethods__
+
+        class NonResettableTransaction(transactions.UpgradeTransaction):
+            __slots__ = ()
+
+            def reset(self, migration: domain_migration.Migration, /) -> None:
+                transactions.MigrationTransaction.reset(self, migration)
+
+        transaction = NonResettableTransaction.create(application.session, migration)
+        with application.session.begin_transaction(
+            transaction,
+            migration=migration2,
+        ) as new_transaction:
+            assert isinstance(new_transaction, NonResettableTransaction)
+            assert new_transaction is not transaction
+
+
+def test_group_bulk_commands() -> None:
+    migration_commands = [
+        commands.InsertOne("abc", {"a": 1}),
+        commands.UpdateOne("abc", {"a": 1}, {"$set": {"b": 1}}),
+        commands.InsertOne("xyz", {"a": 1}),
+        commands.DropCollection("abc"),
+        commands.DeleteOne("abc", {"a": 1}),
+    ]
+
+    batches = list(transactions._group_bulk_commands(migration_commands))
+    assert [batch.collection for batch in batches] == ["abc", "xyz", None, "abc"]
+    assert batches[0].commands == migration_commands[:2]
+    assert len(batches[0].operations) == 2
+
+
+def test_group_bulk_commands_keeps_own_execute() -> None:
+    class AuditedInsertOne(commands.InsertOne):
+        __slots__: typing.Sequence[str] = ()
+
+        def execute(self, ctx: domain_context.MigrationContext) -> typing.Any:
+            return super().execute(ctx)
+
+    migration_commands = [
+        commands.InsertOne("abc", {"a": 1}),
+        AuditedInsertOne("abc", {"a": 2}),
+        commands.InsertMany("abc", []),
+        commands.InsertOne("abc", {"a": 3}),
+    ]
+
+    batches = list(transactions._group_bulk_commands(migration_commands))
+    assert [batch.commands for batch in batches] == [[command] for command in migration_commands]
+    assert [batch.collection for batch in batches] == ["abc", None, None, "abc"]
+
+
+def test_execute_batch_splits_operations(
+    application: applications.MigrationApp,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = application.session.session_client
+    database = client.get_database("abc")
+    context = domain_context.MigrationContext(
+        client=client,
+        database=database,
+        mongodb_session_id="abc",
+        mongorunway_session_id="abc",
+    )
+    monkeypatch.setattr(
+        type(client.admin),
+        "command",
+        lambda self, command, *args, **kwargs: {"maxWriteBatchSize": 2},
+    )
+
+    migration_commands = [commands.InsertOne("abc", {"a": i}) for i in range(5)]
+    (batch,) = transactions._group_bulk_commands(migration_commands)
+
+    calls = []
+    collection_cls = type(database.get_collection("abc"))
+    bulk_write = collection_cls.bulk_write
+
+    def _bulk_write(self, operations, **kwargs):
+        calls.append(len(operations))
+        return bulk_write(self, operations, **kwargs)
+
+    monkeypatch.setattr(collection_cls, "bulk_write", _bulk_write)
+
+    transactions._execute_batch(batch, context)
+    assert calls == [2, 2, 1]
+    assert database.get_collection("abc").count_documents({}) == 5
+
+
+def test_execute_batch_without_hello(
+    application: applications.MigrationApp,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = application.session.session_client
+    database = client.get_database("abc")
+    context = domain_context.MigrationContext(
+        client=client,
+        database=database,
+        mongodb_session_id="abc",
+        mongorunway_session_id="abc",
+    )
+
+    def _command(self, command, *args, **kwargs):
+        raise errors.OperationFailure(f"no such command: {command!r}")
+
+    monkeypatch.setattr(type(client.admin), "command", _command)
+
+    (batch,) = transactions._group_bulk_commands(
+        [commands.InsertOne("abc", {"a": i}) for i in range(3)]
+    )
+    transactions._execute_batch(batch, context)
+    assert database.get_collection("abc").count_documents({}) == 3
@@ -20,6 +20,8 @@
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
+import copy
+import dataclasses
 import typing
 
 import pytest
@@ -78,11 +80,31 @@ class TestMigration:
         assert test_migration.downgrade_process.commands == []
         assert test_migration.downgrade_process.migration_version == 1
 
+    def test_read_only_properties(self, test_migration: domain_migration.Migration) -> None:
+        with pytest.raises(AttributeError):
+            test_migration.version = 2  # type: ignore[misc]
+
+        with pytest.raises(AttributeError):
+            test_migration.is_applied = False  # type: ignore[misc]
+
     def test_set_is_applied(self, test_migration: domain_migration.Migration) -> None:
         assert test_migration.is_applied
         test_migration.set_is_applied(False)
         assert not test_migration.is_applied
 
+    def test_is_independent_of(
+        self,
+        test_migration: domain_migration.Migration,
+        make_migration: typing.Callable[..., domain_migration.Migration],
+    ) -> None:
+        assert test_migration.touches is None
+        assert not test_migration.is_independent_of(make_migration(2, {"users"}))
+
+        users_migration = make_migration(2, {"users"})
+        assert users_migration.touches == frozenset({"users"})
+        assert users_migration.is_independent_of(make_migration(2, {"orders"}))
+        assert not users_migration.is_independent_of(make_migration(2, {"users", "orders"}))
+
     def test_to_dict(self, test_migration: domain_migration.Migration) -> None:
         expected_dict = {
             "name": "test_migration",
@@ -124,6 +146,40 @@ class TestMigrationReadModel:
         assert read_model.description == test_migration.description
         assert read_model.is_applied == test_migration.is_applied
 
+    def test_from_migration_is_cached(self, test_migration: domain_migration.Migration) -> None:
+        read_model = domain_migration.MigrationReadModel.from_migration(test_migration)
+        assert domain_migration.MigrationReadModel.from_migration(test_migration) is read_model
+
+        test_migration.set_is_applied(not test_migration.is_applied)
+        changed_read_model = domain_migration.MigrationReadModel.from_migration(test_migration)
+        assert changed_read_model is not read_model
+        assert changed_read_model.is_applied is test_migration.is_applied
+
+    def test_from_dict_is_shared(self, test_migration_dict: typing.Dict[str, typing.Any]) -> None:
+        read_model = domain_migration.MigrationReadModel.from_dict(test_migration_dict)
+        assert (
+            domain_migration.MigrationReadModel.from_dict(dict(test_migration_dict)) is read_model
+        )
+
+    def test_from_dict_does_not_mutate(
+        self, test_migration_dict: typing.Dict[str, typing.Any]
+    ) -> None:
+        record = {"_id": 1, **test_migration_dict, "extra": True}
+        read_model = domain_migration.MigrationReadModel.from_dict(record)
+
+        assert record["_id"] == 1
+        assert read_model == domain_migration.MigrationReadModel.from_dict(test_migration_dict)
+
+    def test_slots(self, test_migration: domain_migration.Migration) -> None:
+        read_model = domain_migration.MigrationReadModel.from_migration(test_migration)
+        assert not hasattr(read_model, "__dict__")
+        assert copy.deepcopy(read_model) == read_model
+
+    def test_frozen(self, test_migration: domain_migration.Migration) -> None:
+        read_model = domain_migration.MigrationReadModel.from_migration(test_migration)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            read_model.name = "abc"  # type: ignore[misc]
+
 
 class TestMigrationProcess:
     def test_name(self) -> None:
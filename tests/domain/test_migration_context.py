@@ -0,0 +1,55 @@
+# Copyright (c) 2023 Animatea
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from __future__ import annotations
+
+import typing
+
+from mongorunway.domain import migration_context as domain_context
+
+if typing.TYPE_CHECKING:
+    from mongorunway import mongo
+
+
+def test_get_collection_is_cached(mongodb: mongo.Database) -> None:
+    ctx = domain_context.MigrationContext(
+        client=mongodb.client,
+        database=mongodb,
+        mongodb_session_id="abc",
+        mongorunway_session_id="abc",
+    )
+
+    collection = ctx.get_collection("abc")
+    assert collection.name == "abc"
+    assert ctx.get_collection("abc") is collection
+    assert ctx.get_collection("xyz") is not collection
+
+
+def test_get_database_is_cached(mongodb: mongo.Database) -> None:
+    ctx = domain_context.MigrationContext(
+        client=mongodb.client,
+        database=mongodb,
+        mongodb_session_id="abc",
+        mongorunway_session_id="abc",
+    )
+
+    database = ctx.get_database("abc")
+    assert database.name == "abc"
+    assert ctx.get_database("abc") is database
@@ -33,3 +33,15 @@ def test_event_handler_proxy() -> None:
     proxy = domain_event.EventHandlerProxy(priority=1, handler=fake_event_handler)
     assert proxy.handler == fake_event_handler
     assert proxy.priority == 1
+
+
+def test_event_handler_proxy_equality() -> None:
+    proxy = domain_event.EventHandlerProxy(priority=1, handler=fake_event_handler)
+    same_priority = domain_event.EventHandlerProxy(priority=1, handler=print)
+    other_priority = domain_event.EventHandlerProxy(priority=2, handler=fake_event_handler)
+
+    assert proxy == same_priority
+    assert hash(proxy) == hash(same_priority)
+    assert proxy != other_priority
+    assert proxy < other_priority
+    assert proxy != fake_event_handler
@@ -48,6 +48,18 @@ def test_migration_module(migration_module: domain_module.MigrationBusinessModul
     assert migration_module.location == "a/b/c"
     assert migration_module.description == "abc"
     assert migration_module.get_name() == "my_migration_module"
+    assert migration_module.touches is None
+
+
+def test_migration_module_touches(module: types.ModuleType) -> None:
+    module.__name__ = "myapp.migrations.my_migration_module"
+    module.version = 1
+    module.touches = ["users", "orders"]
+    module.upgrade = lambda: []
+    module.downgrade = lambda: []
+
+    migration_module = domain_module.MigrationBusinessModule(module)
+    assert migration_module.touches == frozenset({"users", "orders"})
 
 
 def test_missing_upgrade_commands(module: types.ModuleType) -> None:
@@ -74,3 +86,48 @@ def test_missing_downgrade_commands(module: types.ModuleType) -> None:
         ValueError, match=f"Can't find 'downgrade' process in 'my_migration_module' migration."
     ):
         domain_module.MigrationBusinessModule(module)
+
+
+def test_none_upgrade_commands(module: types.ModuleType) -> None:
+    module.__name__ = "myapp.migrations.my_migration_module"
+    module.version = -1
+    module.upgrade = None
+    module.downgrade = lambda: []
+
+    with pytest.raises(
+        ValueError, match=f"Can't find 'upgrade' process in 'my_migration_module' migration."
+    ):
+        domain_module.MigrationBusinessModule(module)
+
+
+def test_migration_module_name_without_package(module: types.ModuleType) -> None:
+    module.version = 1
+    module.upgrade = lambda: []
+    module.downgrade = lambda: []
+
+    migration_module = domain_module.MigrationBusinessModule(module)
+    assert migration_module.get_name() == "my_migration_module"
+
+
+def test_migration_module_metadata_is_cached(
+    module: types.ModuleType,
+    migration_module: domain_module.MigrationBusinessModule,
+) -> None:
+    module.__name__ = "myapp.migrations.other_module"
+    module.__doc__ = "xyz"
+    module.version = 2
+    module.touches = ["users"]
+
+    assert migration_module.get_name() == "my_migration_module"
+    assert migration_module.description == "abc"
+    assert migration_module.version == -1
+    assert migration_module.touches is None
+
+
+def test_migration_module_without_version(module: types.ModuleType) -> None:
+    module.upgrade = lambda: []
+    module.downgrade = lambda: []
+
+    migration_module = domain_module.MigrationBusinessModule(module)
+    with pytest.raises(AttributeError):
+        migration_module.version
@@ -300,3 +300,40 @@ def test_bulk_write(ctx: domain_context.MigrationContext) -> None:
 
     assert collection.count_documents({}) == 2
     assert collection.find_one({"_id": 1})["field"] == 3
+
+
+def test_bulk_ops(ctx: domain_context.MigrationContext) -> None:
+    assert CreateCollection("abc").bulk_ops() is None
+    assert InsertOne("abc", {"a": 1}, bypass_document_validation=True).bulk_ops() is None
+
+    collection, operations = InsertMany("abc", [{"a": 1}, {"a": 2}]).bulk_ops()
+    assert collection == "abc"
+    assert operations == [pymongo.InsertOne({"a": 1}), pymongo.InsertOne({"a": 2})]
+
+    _, operations = UpdateOne("abc", {"a": 1}, {"$set": {"b": 1}}).bulk_ops()
+    ctx.database.get_collection("abc").bulk_write(operations)
+
+
+def test_bulk_ops_fall_back_to_execute() -> None:
+    class AuditedInsertOne(InsertOne):
+        __slots__: typing.Sequence[str] = ()
+
+        def execute(self, ctx: domain_context.MigrationContext) -> typing.Any:
+            return super().execute(ctx)
+
+    assert AuditedInsertOne("abc", {"a": 1}).bulk_ops() is None
+
+    # Rejected by `insert_many` and `bulk_write` themselves.
+    assert InsertMany("abc", []).bulk_ops() is None
+    assert BulkWrite("abc", []).bulk_ops() is None
+
+    # An iterator is consumed only once, by `execute`.
+    assert InsertMany("abc", iter([{"a": 1}])).bulk_ops() is None
+
+
+def test_schema_commands_are_not_shared() -> None:
+    cmd = CreateCollection("abc", 1)
+    other = CreateCollection("abc", True)
+    assert other is not cmd
+    assert cmd.args == (1,) and type(cmd.args[0]) is int
+    assert other.args == (True,) and type(other.args[0]) is bool
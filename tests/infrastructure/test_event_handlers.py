@@ -52,6 +52,10 @@ def test_sync_scripts_with_queues(
     sync_scripts_with_repository(domain_event.ApplicationEvent(application=application))
     assert len(list(application.session.get_all_migration_models())) == 1
 
+    # Already synced migrations are skipped.
+    sync_scripts_with_repository(domain_event.ApplicationEvent(application=application))
+    assert len(list(application.session.get_all_migration_models())) == 1
+
 
 def test_recalculate_migrations_checksum(
     migration: domain_migration.Migration,
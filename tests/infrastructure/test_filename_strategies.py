@@ -76,6 +76,16 @@ class TestMissingFilenameStrategy:
     ) -> None:
         assert missing_strategy.transform_migration_filename(filename, position) == expected_result
 
+    def test_is_noop(
+        self,
+        missing_strategy: MissingFilenameStrategy,
+        numerical_strategy: NumericalFilenameStrategy,
+        unix_strategy: UnixFilenameStrategy,
+    ) -> None:
+        assert missing_strategy.IS_NOOP
+        assert not numerical_strategy.IS_NOOP
+        assert not unix_strategy.IS_NOOP
+
 
 class TestNumericalFilenameStrategy:
     @pytest.mark.parametrize(
@@ -86,6 +96,8 @@ class TestNumericalFilenameStrategy:
             ("003_file.txt", True),
             ("file.txt", False),
             ("abc_file.txt", False),
+            ("01", False),
+            ("\u00b9\u00b2\u00b3_file.txt", False),
         ],
     )
     def test_is_valid_filename(
@@ -103,6 +115,8 @@ class TestNumericalFilenameStrategy:
             ("002_file.txt", 2, "002_file.txt"),
             ("file.txt", 1, "001_file.txt"),
             ("abc_file.txt", 2, "002_abc_file.txt"),
+            ("_abc__file_.txt", 3, "003_abc_file_.txt"),
+            ("abc_file_", 4, "004_abc_file"),
         ],
     )
     def test_transform_migration_filename(
@@ -129,6 +143,9 @@ class TestUnixFilenameStrategy:
             ("12345678901234567890_file.txt", True),
             ("file.txt", False),
             ("12345_file.txt", False),
+            ("123456789", False),
+            ("123456789a_file.txt", False),
+            ("1234567890", True),
         ],
     )
     def test_is_valid_filename(
@@ -25,11 +25,11 @@ import typing
 import pytest
 
 from mongorunway.application.ports import repository as repository_port
+from mongorunway.domain import migration as domain_migration
 from mongorunway.infrastructure.persistence.repositories import MongoModelRepositoryImpl
 
 if typing.TYPE_CHECKING:
     from mongorunway import mongo
-    from mongorunway.domain import migration as domain_migration
 
 
 class TestMigrationRepositoryImpl:
@@ -44,11 +44,15 @@ class TestMigrationRepositoryImpl:
         self,
         repository: repository_port.MigrationModelRepository,
         migration: domain_migration.Migration,
+        migration2: domain_migration.Migration,
     ) -> None:
         assert len(repository) == 0
         repository.append_migration(migration)
         assert len(repository) == 1
 
+        repository.append_migration(migration2)
+        assert len(repository) == 2
+
     def test_contains(
         self,
         repository: repository_port.MigrationModelRepository,
@@ -103,6 +107,18 @@ class TestMigrationRepositoryImpl:
         assert model.checksum == migration.checksum
         assert model.description == migration.description
 
+    def test_acquire_migration_model_ignores_extra_fields(
+        self,
+        mongodb: mongo.Database,
+        repository: repository_port.MigrationModelRepository,
+        migration: domain_migration.Migration,
+    ) -> None:
+        mongodb.test_collection.insert_one({**migration.to_dict(unique=True), "extra": "field"})
+
+        model = repository.acquire_migration_model_by_version(migration.version)
+        assert model == domain_migration.MigrationReadModel.from_migration(migration)
+        assert list(repository.acquire_all_migration_models()) == [model]
+
     def test_acquire_migration_model_by_flag(
         self,
         repository: repository_port.MigrationModelRepository,
@@ -150,6 +166,9 @@ class TestMigrationRepositoryImpl:
         models = repository.acquire_all_migration_models()
         assert len(list(models)) == 2
 
+        models = repository.acquire_all_migration_models(ascending_id=False)
+        assert [model.version for model in models] == [migration2.version, migration.version]
+
     def test_append_migration(
         self,
         repository: repository_port.MigrationModelRepository,
@@ -171,6 +190,21 @@ class TestMigrationRepositoryImpl:
         repository.remove_migration(migration.version)
         assert migration not in repository
 
+    def test_remove_migrations(
+        self,
+        repository: repository_port.MigrationModelRepository,
+        migration: domain_migration.Migration,
+        migration2: domain_migration.Migration,
+    ) -> None:
+        assert repository.remove_migrations([]) == []
+
+        repository.append_migrations([migration, migration2])
+        assert repository.remove_migrations([migration.version, migration2.version]) == [
+            migration.version,
+            migration2.version,
+        ]
+        assert not repository.has_migrations()
+
     def test_set_applied_flag(
         self,
         repository: repository_port.MigrationModelRepository,
@@ -181,3 +215,15 @@ class TestMigrationRepositoryImpl:
 
         repository.set_applied_flag(migration, is_applied=True)
         assert repository.acquire_migration_model_by_version(migration.version).is_applied
+
+    def test_append_migrations(
+        self,
+        repository: repository_port.MigrationModelRepository,
+        migration: domain_migration.Migration,
+        migration2: domain_migration.Migration,
+    ) -> None:
+        assert repository.append_migrations([]) == []
+        assert repository.acquire_migration_versions() == frozenset()
+
+        assert repository.append_migrations([migration, migration2]) == [1, 2]
+        assert repository.acquire_migration_versions() == {1, 2}
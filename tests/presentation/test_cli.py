@@ -0,0 +1,138 @@
+# Copyright (c) 2023 Animatea
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from __future__ import annotations
+
+import pathlib
+import typing
+
+import pytest
+from click import testing
+
+from mongorunway.application import filesystem
+from mongorunway.application import use_cases
+from mongorunway.presentation import cli
+
+CONFIGURATION: typing.Final[
+    str
+] = """\
+mongorunway:
+  filesystem:
+    scripts_dir: migrations
+  applications:
+    test:
+      app_client:
+        host: localhost
+        port: 27017
+      app_database: TestDatabase
+      app_repository:
+        type: mongorunway.infrastructure.persistence.repositories.MongoModelRepositoryImpl
+        collection: migrations
+"""
+
+
+@pytest.fixture(scope="function")
+def config_file(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    monkeypatch.setattr(cli, "_configurations", {})
+    monkeypatch.chdir(tmp_path)
+    # Configuration files are searched from the working directory of the import.
+    find_any = filesystem.find_any
+    monkeypatch.setattr(
+        filesystem,
+        "find_any",
+        lambda *filenames, base_dir=str(tmp_path): find_any(*filenames, base_dir=base_dir),
+    )
+
+    (tmp_path / "migrations").mkdir()
+    (tmp_path / "mongorunway.yaml").write_text(CONFIGURATION)
+    return "mongorunway.yaml"
+
+
+@pytest.fixture(scope="function")
+def reads(monkeypatch: pytest.MonkeyPatch) -> typing.List[typing.Optional[str]]:
+    read_configuration = use_cases.read_configuration
+    calls = []
+
+    def counting_read_configuration(
+        config_file: typing.Optional[str], **kwargs: typing.Any
+    ) -> typing.Any:
+        calls.append(config_file)
+        return read_configuration(config_file, **kwargs)
+
+    monkeypatch.setattr(use_cases, "read_configuration", counting_read_configuration)
+    return calls
+
+
+def test_read_configuration_is_cached(
+    config_file: str, reads: typing.List[typing.Optional[str]]
+) -> None:
+    configuration = cli._read_configuration(config_file, "test", False)
+    assert configuration is not use_cases.UseCaseFailed
+    assert cli._read_configuration(config_file, "test", False) is configuration
+    assert reads == [config_file]
+
+    # Another application in the same file is read on its own.
+    assert cli._read_configuration(config_file, "other", False) is use_cases.UseCaseFailed
+    assert reads == [config_file, config_file]
+
+
+def test_read_configuration_after_file_change(
+    config_file: str, reads: typing.List[typing.Optional[str]]
+) -> None:
+    configuration = cli._read_configuration(config_file, "test", False)
+    assert configuration is not use_cases.UseCaseFailed
+
+    # The appended line changes the size even within the same mtime.
+    with open(configuration.filesystem.config_dir, "a") as file:
+        file.write("# changed\n")
+
+    assert cli._read_configuration(config_file, "test", False) is not configuration
+    assert len(reads) == 2
+
+
+def test_read_configuration_without_cache(
+    config_file: str, reads: typing.List[typing.Optional[str]]
+) -> None:
+    configuration = cli._read_configuration(config_file, "test", False)
+    assert (
+        cli._read_configuration(config_file, "test", False, use_cache=False) is not configuration
+    )
+    assert len(reads) == 2
+
+
+def test_no_app_cache_flag(
+    config_file: str,
+    reads: typing.List[typing.Optional[str]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    assert cli._read_configuration(config_file, "test", False) is not use_cases.UseCaseFailed
+
+    # A cached configuration would be used instead of the failing read.
+    monkeypatch.setattr(
+        use_cases,
+        "read_configuration",
+        lambda *args, **kwargs: reads.append(None) or use_cases.UseCaseFailed,
+    )
+    result = testing.CliRunner().invoke(
+        cli.cli, ["version", "test", "--config-file", config_file, "--no-app-cache"]
+    )
+    assert result.exit_code == 2
+    assert "Configuration failed." in result.output
+    assert reads == [config_file, None]
@@ -20,6 +20,7 @@
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
+import collections
 import pathlib
 import types
 import typing
@@ -89,6 +90,17 @@ def test_migration(process_func: types.FunctionType, should_raise: bool) -> None
         assert isinstance(migration(process_func), domain_migration.MigrationProcess)
 
 
+@pytest.mark.parametrize("commands", [[], (), collections.UserList()])
+def test_migration_accepts_sequences(commands: typing.Sequence[typing.Any]) -> None:
+    namespace = {"version": 1, "commands": commands}
+    exec("def upgrade():\n    return commands", namespace)
+
+    process = migration(namespace["upgrade"])
+    assert isinstance(process.commands, tuple)
+    assert list(process.commands) == list(commands)
+    assert process.migration_version == 1
+
+
 @pytest.mark.parametrize(
     "current_version, expected_version, should_raise",
     [
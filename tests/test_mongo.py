@@ -35,6 +35,7 @@ from mongorunway.mongo import Cursor
 from mongorunway.mongo import Database
 from mongorunway.mongo import DocumentType
 from mongorunway.mongo import hint_or_sort_cursor
+from mongorunway.mongo import invalidate_index_cache
 from mongorunway.mongo import translate_index
 
 
@@ -130,6 +131,21 @@ class TestHintOrSortCursor:
         example_cursor.sort.assert_called_once_with([existing_index, missing_index])
         example_cursor.hint.assert_not_called()
 
+    def test_hint_or_sort_cursor_with_all_indexes_existing(self, example_cursor: Cursor) -> None:
+        indexes = [("first_index", 1), "second_index"]
+
+        example_cursor.collection.index_information.return_value = {
+            "first_index": {},
+            "second_index": {},
+        }
+        example_cursor.sort = mock.Mock()
+        example_cursor.hint = mock.Mock()
+
+        hint_or_sort_cursor(example_cursor, indexes=indexes)
+
+        example_cursor.hint.assert_called_once_with(indexes)
+        example_cursor.sort.assert_not_called()
+
     def test_hint_or_sort_cursor_with_empty_indexes(self, example_cursor: Cursor) -> None:
         # Test when no indexes are provided
         example_cursor.collection.index_information.return_value = {}
@@ -140,3 +156,15 @@ class TestHintOrSortCursor:
 
         example_cursor.hint.assert_called_once_with([])
         example_cursor.sort.assert_not_called()
+
+    def test_hint_or_sort_cursor_caches_index_names(self, example_cursor: Cursor) -> None:
+        example_cursor.collection.index_information.return_value = {"example_index": {}}
+        example_cursor.hint = mock.Mock()
+
+        hint_or_sort_cursor(example_cursor, indexes="example_index")
+        hint_or_sort_cursor(example_cursor, indexes="example_index")
+        example_cursor.collection.index_information.assert_called_once()
+
+        invalidate_index_cache(example_cursor.collection)
+        hint_or_sort_cursor(example_cursor, indexes="example_index")
+        assert example_cursor.collection.index_information.call_count == 2
@@ -20,6 +20,8 @@
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
+import importlib
+import os
 import types
 import typing
 
@@ -33,6 +35,7 @@ from mongorunway.util import convert_string
 from mongorunway.util import get_module
 from mongorunway.util import hexlify
 from mongorunway.util import import_obj
+from mongorunway.util import is_valid_file_entry
 from mongorunway.util import is_valid_filename
 
 
@@ -132,6 +135,24 @@ def test_get_module(filename, content, tmp_path):
     assert hasattr(module, "add") or hasattr(module, "multiply")
 
 
+def test_get_module_is_cached(tmp_path):
+    (tmp_path / "module.py").write_text("value = 1")
+    module = get_module(str(tmp_path), "module.py")
+    assert get_module(str(tmp_path), "module") is module
+
+    (tmp_path / "module.py").write_text("value = 22")
+    assert get_module(str(tmp_path), "module.py").value == 22
+
+    with pytest.raises(ModuleNotFoundError):
+        get_module(str(tmp_path), "missing.py")
+
+
+def test_get_module_name(tmp_path):
+    (tmp_path / "copy.py").write_text("value = 1")
+    assert get_module(str(tmp_path), "copy.py").__name__ == "copy"
+    assert get_module(str(tmp_path), "copy").__name__ == "copy"
+
+
 @pytest.mark.parametrize(
     "filename, expected",
     [
@@ -145,6 +166,23 @@ def test_is_valid_migration_filename(filename, expected, tmp_path):
         assert is_valid_filename(str(tmp_path), filename) == expected
 
 
+@pytest.mark.parametrize(
+    "filename, expected",
+    [
+        ("migration.py", True),
+        ("migration.sql", False),
+        ("__init__.py", False),
+    ],
+)
+def test_is_valid_file_entry(filename, expected, tmp_path):
+    (tmp_path / filename).touch()
+    (tmp_path / "directory.py").mkdir()
+
+    entries = {entry.name: entry for entry in os.scandir(tmp_path)}
+    assert is_valid_file_entry(entries[filename]) == expected
+    assert not is_valid_file_entry(entries["directory.py"])
+
+
 @pytest.mark.parametrize(
     "binary, expected_hex",
     [
@@ -173,6 +211,17 @@ def test_import_obj(
     assert imported_obj is expected_obj
 
 
+def test_import_obj_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert import_obj("tests.test_util.FakeUtilClass", FakeUtilClass) is FakeUtilClass
+
+    monkeypatch.setattr(importlib, "import_module", pytest.fail)
+    assert import_obj("tests.test_util.FakeUtilClass", FakeUtilClass) is FakeUtilClass
+
+    monkeypatch.undo()
+    with pytest.raises(ModuleNotFoundError):
+        import_obj("tests.missing_module.FakeUtilClass", FakeUtilClass)
+
+
 @pytest.mark.parametrize(
     "obj, expected_result",
     [